@@ -14,6 +14,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import sys
+
 import numpy
 from Cython.Build import cythonize
 from setuptools import Extension, setup  # noqa: E402
@@ -29,6 +31,13 @@ def window_specialization(typename):
     )
 
 
+def openmp_flags():
+    """Compiler and linker flags enabling OpenMP where GCC is the default."""
+    if sys.platform.startswith("linux"):
+        return ["-fopenmp"]
+    return []
+
+
 ext_options = dict(
     compiler_directives=dict(profile=True, language_level="3"),
     annotate=True,
@@ -64,6 +73,13 @@ ext_modules = [
         sources=["src/zipline/lib/rank.pyx"],
         define_macros=[("NPY_NO_DEPRECATED_API", "NPY_1_7_API_VERSION")],
     ),
+    Extension(
+        name="zipline.lib._drawdown",
+        sources=["src/zipline/lib/_drawdown.pyx"],
+        define_macros=[("NPY_NO_DEPRECATED_API", "NPY_1_7_API_VERSION")],
+        extra_compile_args=openmp_flags(),
+        extra_link_args=openmp_flags(),
+    ),
     Extension(
         name="zipline.data._equities",
         sources=["src/zipline/data/_equities.pyx"],
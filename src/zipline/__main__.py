@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 import errno
 import os
 
@@ -166,7 +167,7 @@ DEFAULT_BUNDLE = "quandl"
 @click.option(
     "--bundle-timestamp",
     type=Timestamp(),
-    default=pd.Timestamp.utcnow(),
+    default=None,
     show_default=False,
     help="The date to lookup data on or before.\n" "[default: <current-time>]",
 )
@@ -376,10 +377,18 @@ def zipline_magic(line, cell=None):
 @click.option(
     "-b",
     "--bundle",
-    default=DEFAULT_BUNDLE,
+    default=[DEFAULT_BUNDLE],
+    multiple=True,
     metavar="BUNDLE-NAME",
     show_default=True,
-    help="The data bundle to ingest.",
+    help="The data bundle to ingest. May be passed more than once.",
+)
+@click.option(
+    "--all",
+    "all_bundles",
+    is_flag=True,
+    default=False,
+    help="Ingest every registered bundle instead of the ones given with -b.",
 )
 @click.option(
     "--assets-version",
@@ -392,15 +401,46 @@ def zipline_magic(line, cell=None):
     default=True,
     help="Print progress information to the terminal.",
 )
-def ingest(bundle, assets_version, show_progress):
-    """Ingest the data for the given bundle."""
-    bundles_module.ingest(
-        bundle,
-        os.environ,
-        pd.Timestamp.utcnow(),
-        assets_version,
-        show_progress,
-    )
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="The number of bundles to ingest concurrently.",
+)
+def ingest(bundle, all_bundles, assets_version, show_progress, jobs):
+    """Ingest the data for the given bundles."""
+    if all_bundles:
+        bundle = _registered_bundles()
+        if not bundle:
+            return
+
+    # ingesting the same bundle twice would write both into one directory
+    bundle = list(dict.fromkeys(bundle))
+    timestamp = pd.Timestamp.utcnow()
+
+    def ingest_bundle(name):
+        bundles_module.ingest(
+            name,
+            os.environ,
+            timestamp,
+            assets_version,
+            show_progress,
+        )
+
+    if jobs == 1 or len(bundle) == 1:
+        # Stay on the main thread so that Ctrl-C interrupts the ingest and
+        # bcolz keeps using multithreaded compression.
+        for name in bundle:
+            ingest_bundle(name)
+        return
+
+    # Bundles are written to separate directories and their ingest is
+    # dominated by downloads, so threads are enough to overlap them.
+    with ThreadPoolExecutor(max_workers=min(jobs, len(bundle))) as executor:
+        # consume the results so that errors are raised here
+        list(executor.map(ingest_bundle, bundle))
 
 
 @main.command()
@@ -444,20 +484,35 @@ def clean(bundle, before, after, keep_last):
     )
 
 
+def _registered_bundles():
+    """The names of the registered bundles, excluding the hidden test data."""
+    return [
+        bundle
+        for bundle in sorted(bundles_module.bundles.keys())
+        if not bundle.startswith(".")
+    ]
+
+
+def _ingestions_for_bundle(bundle):
+    try:
+        return list(map(str, bundles_module.ingestions_for_bundle(bundle)))
+    except OSError as e:
+        if e.errno != errno.ENOENT:
+            raise
+        return []
+
+
 @main.command()
 def bundles():
     """List all of the available data bundles."""
-    for bundle in sorted(bundles_module.bundles.keys()):
-        if bundle.startswith("."):
-            # hide the test data
-            continue
-        try:
-            ingestions = list(map(str, bundles_module.ingestions_for_bundle(bundle)))
-        except OSError as e:
-            if e.errno != errno.ENOENT:
-                raise
-            ingestions = []
+    names = _registered_bundles()
+
+    # Listing the ingestions only touches the filesystem, so scan the bundle
+    # directories concurrently; ``map`` preserves the sorted bundle order.
+    with ThreadPoolExecutor(max_workers=min(8, len(names) or 1)) as executor:
+        all_ingestions = list(executor.map(_ingestions_for_bundle, names))
 
+    for bundle, ingestions in zip(names, all_ingestions):
         # If we got no ingestions, either because the directory didn't exist or
         # because there were no entries, print a single message indicating that
         # no ingestions have yet been made.
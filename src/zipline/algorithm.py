@@ -21,6 +21,7 @@ import logging
 import pytz
 import pandas as pd
 import numpy as np
+from packaging.version import Version
 
 from itertools import chain, repeat
 
@@ -100,6 +101,7 @@ from zipline.utils.input_validation import (
     optionally,
 )
 from zipline.utils.numpy_utils import int64_dtype
+from zipline.utils.pandas_utils import pandas_version
 from zipline.utils.cache import ExpiringCache
 
 import zipline.utils.events
@@ -128,6 +130,9 @@ from zipline.zipline_warnings import ZiplineDeprecationWarning
 
 log = logging.getLogger("ZiplineLog")
 
+# pandas < 2 builds the simulation clock with pytz rather than datetime.timezone.
+_PYTZ_SIMULATION_CLOCK = pandas_version < Version("2.0.0")
+
 # For creating and storing pipeline instances
 AttachedPipeline = namedtuple("AttachedPipeline", "pipe chunks eager")
 
@@ -1455,10 +1460,7 @@ class TradingAlgorithm:
             The current simulation datetime converted to ``tz``.
         """
         dt = self.datetime
-        from packaging.version import Version
-        import pytz
-
-        if Version(pd.__version__) < Version("2.0.0"):
+        if _PYTZ_SIMULATION_CLOCK:
             assert (
                 dt.tzinfo == pytz.utc
             ), f"Algorithm should have a pytc utc datetime, {dt.tzinfo}"
@@ -253,15 +253,23 @@ def _generate_output_dataframe(data_subset, defaults):
     return data_subset
 
 
-def _check_asset_group(group):
-    # workaround until fixed: https://github.com/pandas-dev/pandas/issues/47985
-    if group.empty:
-        return group
-    row = group.sort_values("end_date").iloc[-1]
-    row.start_date = group.start_date.min()
-    row.end_date = group.end_date.max()
-    row.drop(list(symbol_columns), inplace=True)
-    return row
+def _collapse_asset_rows(df):
+    """Collapse the per-symbol rows of each asset into a single row.
+
+    The most recent row (by end date) of each sid supplies the asset's
+    metadata, while its lifetime spans the earliest start date and latest end
+    date across all of the asset's rows.
+    """
+    latest = df.sort_values("end_date", kind="stable")
+    latest = latest[~latest.index.duplicated(keep="last")].sort_index()
+    lifetimes = df.groupby(level=0).agg(
+        start_date=("start_date", "min"),
+        end_date=("end_date", "max"),
+    )
+    out = latest.drop(columns=list(symbol_columns))
+    out["start_date"] = lifetimes["start_date"]
+    out["end_date"] = lifetimes["end_date"]
+    return out
 
 
 def _format_range(r):
@@ -318,9 +326,12 @@ def _check_symbol_mappings(df, exchanges, asset_exchange):
             msg_component = "\n  ".join(str(data).splitlines())
             ambiguous[persymbol.name] = intersections, msg_component
 
-    mappings.groupby(["symbol", "country_code"], group_keys=False).apply(
-        check_intersections
-    )
+    # A symbol held by a single mapping row can't overlap with anything, so
+    # only the (symbol, country_code) pairs that occur more than once need the
+    # per-group check.
+    keys = ["symbol", "country_code"]
+    shared = mappings[mappings.duplicated(keys, keep=False)]
+    shared.groupby(keys, group_keys=False).apply(check_intersections)
 
     if ambiguous:
         raise ValueError(
@@ -380,7 +391,7 @@ def _split_symbol_mappings(df, exchanges):
 
     _check_symbol_mappings(mappings, exchanges, asset_exchange)
     return (
-        df.groupby(level=0, group_keys=False).apply(_check_asset_group),
+        _collapse_asset_rows(df),
         mappings,
     )
 
@@ -398,7 +409,11 @@ def _dt_to_epoch_ns(dt_series: pd.Series) -> pd.Index:
     idx : pd.Index
         The index converted to nanoseconds since the epoch.
     """
-    index = pd.to_datetime(dt_series.values)
+    if dt_series.dtype.kind == "M":
+        # Already datetimes (naive or tz-aware); skip the parsing pass.
+        index = pd.DatetimeIndex(dt_series)
+    else:
+        index = pd.to_datetime(dt_series.values)
     if index.tzinfo is None:
         index = index.tz_localize("UTC")
     else:
@@ -483,8 +498,11 @@ class AssetDBWriter:
         chunk_size,
     ):
         with self.engine.begin() as conn:
-            # Create SQL tables if they do not exist.
-            self.init_db(conn)
+            # Create SQL tables if they do not exist. When the database is new,
+            # building the secondary indexes is deferred until the bulk load
+            # below is done, so that each index is built once instead of being
+            # updated row by row.
+            deferred_indexes = self._init_db(conn, defer_indexes=True)
 
             if exchanges is not None:
                 self._write_df_to_table(
@@ -527,6 +545,9 @@ class AssetDBWriter:
                     mapping_data=equity_symbol_mappings,
                 )
 
+            for index in deferred_indexes:
+                index.create(conn, checkfirst=True)
+
     def write_direct(
         self,
         equities=None,
@@ -913,15 +934,38 @@ class AssetDBWriter:
             if txn is None:
                 txn = stack.enter_context(self.engine.begin())
 
-            tables_already_exist = self._all_tables_present(txn)
+            self._init_db(txn)
+
+    def _init_db(self, txn, defer_indexes=False):
+        """Create the tables in the open transaction ``txn``.
+
+        If ``defer_indexes`` is True and the database is new, the tables are
+        created without their secondary indexes, and the unbuilt indexes are
+        returned so the caller can create them once the data is loaded.
 
+        Returns
+        -------
+        deferred_indexes : list[sa.Index]
+            The indexes that still need to be created.
+        """
+        tables_already_exist = self._all_tables_present(txn)
+
+        if defer_indexes and not tables_already_exist:
+            deferred_indexes = []
+            for table in metadata.sorted_tables:
+                txn.execute(sa.schema.CreateTable(table, if_not_exists=True))
+                deferred_indexes.extend(table.indexes)
+        else:
             # Create the SQL tables if they do not already exist.
             metadata.create_all(txn, checkfirst=True)
+            deferred_indexes = []
+
+        if tables_already_exist:
+            check_version_info(txn, version_info, ASSET_DB_VERSION)
+        else:
+            write_version_info(txn, version_info, ASSET_DB_VERSION)
 
-            if tables_already_exist:
-                check_version_info(txn, version_info, ASSET_DB_VERSION)
-            else:
-                write_version_info(txn, version_info, ASSET_DB_VERSION)
+        return deferred_indexes
 
     def _normalize_equities(self, equities, exchanges):
         # HACK: If 'company_name' is provided, map it to asset_name
@@ -273,6 +273,9 @@ class AssetFinder:
     :class:`zipline.assets.AssetDBWriter`
     """
 
+    # Number of rows converted at a time when computing asset lifetimes.
+    _LIFETIMES_BATCH_SIZE = 10000
+
     @preprocess(engine=coerce_string_to_eng(require_exists=True))
     def __init__(self, engine, future_chain_predicates=CHAIN_PREDICATES):
         self.engine = engine
@@ -1019,6 +1022,17 @@ class AssetFinder:
         if mapping is None:
             raise SymbolNotFound(symbol=symbols[0])
 
+        # Load every asset that has held one of the requested symbols with a
+        # single batched query instead of one query per symbol.
+        if fuzzy:
+            keys = ("".join(split_delimited_symbol(s.upper())) for s in set(symbols))
+        else:
+            keys = (split_delimited_symbol(s) for s in set(symbols))
+        self.retrieve_all(
+            {owner.sid for key in keys for owner in mapping.get(key, ())},
+            default_none=True,
+        )
+
         memo = {}
         out = []
         append_output = out.append
@@ -1378,7 +1392,7 @@ class AssetFinder:
 
     def _compute_asset_lifetimes(self, **kwargs):
         """Compute and cache a recarray of asset lifetimes"""
-        sids = starts = ends = []
+        sids, starts, ends = [], [], []
         equities_cols = self.equities.c
         exchanges_cols = self.exchanges.c
         if len(kwargs) == 1:
@@ -1396,13 +1410,19 @@ class AssetFinder:
                     ).where(
                         (exchanges_cols.exchange == equities_cols.exchange) & (condt)
                     )
-                ).fetchall()
-            if results:
-                sids, starts, ends = zip(*results)
-
-        sid = np.array(sids, dtype="i8")
-        start = np.array(starts, dtype="f8")
-        end = np.array(ends, dtype="f8")
+                )
+                # Convert the result to arrays a batch of rows at a time so
+                # that only one batch of row objects is alive at once. Missing
+                # dates come through as NaN.
+                for batch in results.partitions(self._LIFETIMES_BATCH_SIZE):
+                    batch_sids, batch_starts, batch_ends = zip(*batch)
+                    sids.append(np.array(batch_sids, dtype="i8"))
+                    starts.append(np.array(batch_starts, dtype="f8"))
+                    ends.append(np.array(batch_ends, dtype="f8"))
+
+        sid = np.concatenate(sids) if sids else np.array([], dtype="i8")
+        start = np.concatenate(starts) if starts else np.array([], dtype="f8")
+        end = np.concatenate(ends) if ends else np.array([], dtype="f8")
         start[np.isnan(start)] = 0  # convert missing starts to 0
         end[np.isnan(end)] = np.iinfo(int).max  # convert missing end to INTMAX
         return Lifetimes(sid, start.astype("i8"), end.astype("i8"))
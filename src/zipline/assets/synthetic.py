@@ -1,6 +1,7 @@
 from itertools import product
 from string import ascii_uppercase
 
+import numpy as np
 import pandas as pd
 from pandas.tseries.offsets import MonthBegin
 
@@ -259,22 +260,32 @@ def make_future_info(
         )
     )
 
-    contracts = []
-    parts = product(root_symbols, contract_suffix_to_beginning_of_month)
-    for sid, (root_sym, (suffix, month_begin)) in enumerate(parts, first_sid):
-        contracts.append(
-            {
-                "sid": sid,
-                "root_symbol": root_sym,
-                "symbol": root_sym + suffix,
-                "start_date": start_date_func(month_begin),
-                "notice_date": notice_date_func(month_begin),
-                "expiration_date": expiration_date_func(month_begin),
-                "multiplier": multiplier,
-                "exchange": "TEST",
-            }
-        )
-    return pd.DataFrame.from_records(contracts, index="sid")
+    suffixes, month_begins = zip(*contract_suffix_to_beginning_of_month)
+    contracts = pd.MultiIndex.from_product([root_symbols, suffixes])
+    root_symbol = contracts.get_level_values(0)
+
+    # The dates only depend on the contract month, so evaluate each date
+    # function once per month and broadcast the results over root symbols.
+    month_ix = np.tile(np.arange(len(month_begins)), len(root_symbols))
+
+    def per_contract(date_func):
+        return pd.Series([date_func(mb) for mb in month_begins]).iloc[month_ix].array
+
+    return pd.DataFrame(
+        {
+            "root_symbol": root_symbol,
+            "symbol": root_symbol + contracts.get_level_values(1),
+            "start_date": per_contract(start_date_func),
+            "notice_date": per_contract(notice_date_func),
+            "expiration_date": per_contract(expiration_date_func),
+            "multiplier": multiplier,
+            "exchange": "TEST",
+        },
+        index=pd.Index(
+            np.arange(first_sid, first_sid + len(contracts)),
+            name="sid",
+        ),
+    )
 
 
 def make_commodity_future_info(
@@ -68,6 +68,22 @@ SQLITE_STOCK_DIVIDEND_PAYOUT_COLUMN_DTYPES = {
     "ratio": float,
 }
 
+SQLITE_PAYOUT_DATE_COLUMNS = ["ex_date", "record_date", "declared_date", "pay_date"]
+
+# (index name, table, column) for every index built by SQLiteAdjustmentWriter.
+SQLITE_ADJUSTMENT_INDEXES = (
+    ("splits_sids", "splits", "sid"),
+    ("splits_effective_date", "splits", "effective_date"),
+    ("mergers_sids", "mergers", "sid"),
+    ("mergers_effective_date", "mergers", "effective_date"),
+    ("dividends_sid", "dividends", "sid"),
+    ("dividends_effective_date", "dividends", "effective_date"),
+    ("dividend_payouts_sid", "dividend_payouts", "sid"),
+    ("dividends_payouts_ex_date", "dividend_payouts", "ex_date"),
+    ("stock_dividend_payouts_sid", "stock_dividend_payouts", "sid"),
+    ("stock_dividends_payouts_ex_date", "stock_dividend_payouts", "ex_date"),
+)
+
 
 def specialize_any_integer(d):
     out = {}
@@ -79,6 +95,17 @@ def specialize_any_integer(d):
     return out
 
 
+def _dates_to_seconds(frame):
+    """Convert every datetime column of ``frame`` to seconds since the epoch.
+
+    Each column is cast from its own values because the columns may mix
+    tz-aware and naive dtypes, which makes ``frame.values`` an object array.
+    """
+    return np.column_stack(
+        [frame[c].values.astype("datetime64[s]") for c in frame]
+    ).astype(int64_dtype)
+
+
 class SQLiteAdjustmentReader:
     """Loads adjustments based on corporate actions from a SQLite database.
 
@@ -349,13 +376,25 @@ class SQLiteAdjustmentWriter:
     overwrite : bool, optional, default=False
         If True and conn_or_path is a string, remove any existing files at the
         given path before connecting.
+    chunk_size : int, optional
+        The number of rows to insert into a table per batch. Larger batches
+        amortize the per-statement overhead at the cost of a larger working
+        set. Defaults to ``DEFAULT_CHUNK_SIZE``.
 
     See Also
     --------
     zipline.data.adjustments.SQLiteAdjustmentReader
     """
 
-    def __init__(self, conn_or_path, equity_daily_bar_reader, overwrite=False):
+    DEFAULT_CHUNK_SIZE = 50000
+
+    def __init__(
+        self,
+        conn_or_path,
+        equity_daily_bar_reader,
+        overwrite=False,
+        chunk_size=DEFAULT_CHUNK_SIZE,
+    ):
         if isinstance(conn_or_path, sqlite3.Connection):
             self.conn = conn_or_path
         elif isinstance(conn_or_path, str):
@@ -371,6 +410,7 @@ class SQLiteAdjustmentWriter:
             raise TypeError("Unknown connection type %s" % type(conn_or_path))
 
         self._equity_daily_bar_reader = equity_daily_bar_reader
+        self._chunk_size = chunk_size
 
     def __enter__(self):
         return self
@@ -417,7 +457,7 @@ class SQLiteAdjustmentWriter:
             tablename,
             self.conn,
             if_exists="append",
-            chunksize=50000,
+            chunksize=self._chunk_size,
         )
 
     def write_frame(self, tablename, frame):
@@ -512,7 +552,7 @@ class SQLiteAdjustmentWriter:
                 " sid=%(sid)s, ex_date=%(ex_date)s, amount=%(amount).3f",
                 {
                     "sid": input_sids[ix],
-                    "ex_date": pd.Timestamp(input_dates[ix]).strftime("%Y-%m-%d"),
+                    "ex_date": np.datetime_as_string(input_dates[ix], unit="D"),
                     "amount": amount[ix],
                 },
             )
@@ -524,7 +564,7 @@ class SQLiteAdjustmentWriter:
                 " sid=%(sid)s, ex_date=%(ex_date)s, amount=%(amount).3f",
                 {
                     "sid": input_sids[ix],
-                    "ex_date": pd.Timestamp(input_dates[ix]).strftime("%Y-%m-%d"),
+                    "ex_date": np.datetime_as_string(input_dates[ix], unit="D"),
                     "amount": amount[ix],
                 },
             )
@@ -542,28 +582,14 @@ class SQLiteAdjustmentWriter:
         if dividends is None:
             dividend_payouts = None
         else:
-            dividend_payouts = dividends.copy()
             # TODO: Check if that's the right place for this fix for pandas > 1.2.5
-            dividend_payouts.fillna(np.datetime64("NaT"), inplace=True)
-            dividend_payouts["ex_date"] = (
-                dividend_payouts["ex_date"]
-                .values.astype("datetime64[s]")
-                .astype(int64_dtype)
-            )
-            dividend_payouts["record_date"] = (
-                dividend_payouts["record_date"]
-                .values.astype("datetime64[s]")
-                .astype(int64_dtype)
-            )
-            dividend_payouts["declared_date"] = (
-                dividend_payouts["declared_date"]
-                .values.astype("datetime64[s]")
-                .astype(int64_dtype)
+            # Only the date columns need their missing values filled and
+            # converted; the rest of the frame is copied once, by assign.
+            seconds = _dates_to_seconds(
+                dividends[SQLITE_PAYOUT_DATE_COLUMNS].fillna(np.datetime64("NaT")),
             )
-            dividend_payouts["pay_date"] = (
-                dividend_payouts["pay_date"]
-                .values.astype("datetime64[s]")
-                .astype(int64_dtype)
+            dividend_payouts = dividends.assign(
+                **dict(zip(SQLITE_PAYOUT_DATE_COLUMNS, seconds.T))
             )
 
         self.write_dividend_payouts(dividend_payouts)
@@ -573,25 +599,8 @@ class SQLiteAdjustmentWriter:
             stock_dividend_payouts = None
         else:
             stock_dividend_payouts = stock_dividends.copy()
-            stock_dividend_payouts["ex_date"] = (
-                stock_dividend_payouts["ex_date"]
-                .values.astype("datetime64[s]")
-                .astype(int64_dtype)
-            )
-            stock_dividend_payouts["record_date"] = (
-                stock_dividend_payouts["record_date"]
-                .values.astype("datetime64[s]")
-                .astype(int64_dtype)
-            )
-            stock_dividend_payouts["declared_date"] = (
-                stock_dividend_payouts["declared_date"]
-                .values.astype("datetime64[s]")
-                .astype(int64_dtype)
-            )
-            stock_dividend_payouts["pay_date"] = (
-                stock_dividend_payouts["pay_date"]
-                .values.astype("datetime64[s]")
-                .astype(int64_dtype)
+            stock_dividend_payouts[SQLITE_PAYOUT_DATE_COLUMNS] = _dates_to_seconds(
+                stock_dividend_payouts[SQLITE_PAYOUT_DATE_COLUMNS],
             )
         self.write_stock_dividend_payouts(stock_dividend_payouts)
 
@@ -681,37 +690,13 @@ class SQLiteAdjustmentWriter:
         self.write_frame("splits", splits)
         self.write_frame("mergers", mergers)
         self.write_dividend_data(dividends, stock_dividends)
-        # Use IF NOT EXISTS here to allow multiple writes if desired.
-        self.conn.execute("CREATE INDEX IF NOT EXISTS splits_sids " "ON splits(sid)")
-        self.conn.execute(
-            "CREATE INDEX IF NOT EXISTS splits_effective_date "
-            "ON splits(effective_date)"
-        )
-        self.conn.execute("CREATE INDEX IF NOT EXISTS mergers_sids " "ON mergers(sid)")
-        self.conn.execute(
-            "CREATE INDEX IF NOT EXISTS mergers_effective_date "
-            "ON mergers(effective_date)"
-        )
-        self.conn.execute(
-            "CREATE INDEX IF NOT EXISTS dividends_sid " "ON dividends(sid)"
-        )
-        self.conn.execute(
-            "CREATE INDEX IF NOT EXISTS dividends_effective_date "
-            "ON dividends(effective_date)"
-        )
-        self.conn.execute(
-            "CREATE INDEX IF NOT EXISTS dividend_payouts_sid "
-            "ON dividend_payouts(sid)"
-        )
-        self.conn.execute(
-            "CREATE INDEX IF NOT EXISTS dividends_payouts_ex_date "
-            "ON dividend_payouts(ex_date)"
-        )
-        self.conn.execute(
-            "CREATE INDEX IF NOT EXISTS stock_dividend_payouts_sid "
-            "ON stock_dividend_payouts(sid)"
-        )
-        self.conn.execute(
-            "CREATE INDEX IF NOT EXISTS stock_dividends_payouts_ex_date "
-            "ON stock_dividend_payouts(ex_date)"
+        # Build all of the indices in a single transaction. Use IF NOT EXISTS
+        # here to allow multiple writes if desired.
+        self.conn.executescript(
+            "BEGIN;\n"
+            + "".join(
+                f"CREATE INDEX IF NOT EXISTS {name} ON {table}({column});\n"
+                for name, table, column in SQLITE_ADJUSTMENT_INDEXES
+            )
+            + "COMMIT;"
         )
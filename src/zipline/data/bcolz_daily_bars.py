@@ -27,7 +27,7 @@ from zipline.data.bar_reader import NoDataAfterDate, NoDataBeforeDate, NoDataOnD
 from zipline.data.session_bars import CurrencyAwareSessionBarReader
 from zipline.utils.calendar_utils import get_calendar
 from zipline.utils.cli import maybe_show_progress
-from zipline.utils.functional import apply
+from zipline.utils.functional import apply, prefetch
 from zipline.utils.input_validation import expect_element
 from zipline.utils.memoize import lazyval
 from zipline.utils.numpy_utils import float64_dtype, iNaT, uint32_dtype
@@ -48,6 +48,8 @@ US_EQUITY_PRICING_BCOLZ_COLUMNS = (
 )
 
 UINT32_MAX = np.iinfo(np.uint32).max
+SECONDS_PER_DAY = 24 * 60 * 60
+CSV_PREFETCH_SIZE = 8
 
 
 def check_uint32_safe(value, colname):
@@ -74,22 +76,24 @@ def winsorise_uint32(df, invalid_data_behavior, column, *columns):
         ``df`` with values that do not fit into a uint32 zeroed out.
     """
     columns = list((column,) + columns)
-    mask = df[columns] > UINT32_MAX
+    # Check the values as one block; most assets have nothing to zero out, so
+    # the frame is only written to when something was found.
+    values = df[columns].to_numpy()
+    mask = values > UINT32_MAX
 
     if invalid_data_behavior != "ignore":
-        mask |= df[columns].isnull()
+        mask |= pd.isnull(values)
     else:
         # we are not going to generate a warning or error for this so just use
         # nan_to_num
-        df[columns] = np.nan_to_num(df[columns])
+        df[columns] = np.nan_to_num(values)
 
-    mv = mask.values
-    if mv.any():
+    if mask.any():
         if invalid_data_behavior == "raise":
             raise ValueError(
                 "%d values out of bounds for uint32: %r"
                 % (
-                    mv.sum(),
+                    mask.sum(),
                     df[mask.any(axis=1)],
                 ),
             )
@@ -98,13 +102,15 @@ def winsorise_uint32(df, invalid_data_behavior, column, *columns):
                 "Ignoring %d values because they are out of bounds for"
                 " uint32:\n %r"
                 % (
-                    mv.sum(),
+                    mask.sum(),
                     df[mask.any(axis=1)],
                 ),
                 stacklevel=3,  # one extra frame for `expect_element`
             )
 
-    df[mask] = 0
+        for ix in np.flatnonzero(mask.any(axis=0)):
+            df.loc[mask[:, ix], columns[ix]] = 0
+
     return df
 
 
@@ -185,7 +191,7 @@ class BcolzDailyBarWriter:
             The newly-written table.
         """
         ctx = maybe_show_progress(
-            ((sid, self.to_ctable(df, invalid_data_behavior)) for sid, df in data),
+            ((sid, self._to_columns(df, invalid_data_behavior)) for sid, df in data),
             show_progress=show_progress,
             item_show_func=self.progress_bar_item_show_func,
             label=self.progress_bar_message,
@@ -214,8 +220,14 @@ class BcolzDailyBarWriter:
             index_col="day",
             dtype=self._csv_dtypes,
         )
+        # Read the next files on a background thread while the current
+        # asset is being converted and appended, rather than waiting on each
+        # file in turn.
         return self.write(
-            ((asset, read(path)) for asset, path in asset_map.items()),
+            prefetch(
+                ((asset, read(path)) for asset, path in asset_map.items()),
+                maxsize=CSV_PREFETCH_SIZE,
+            ),
             assets=asset_map.keys(),
             show_progress=show_progress,
             invalid_data_behavior=invalid_data_behavior,
@@ -224,7 +236,8 @@ class BcolzDailyBarWriter:
     def _write_internal(self, iterator, assets):
         """Internal implementation of write.
 
-        `iterator` should be an iterator yielding pairs of (asset, ctable).
+        `iterator` should be an iterator yielding pairs of (asset, table),
+        where table is a ctable or a dict mapping column name to array.
         """
         total_rows = 0
         first_row = {}
@@ -241,6 +254,9 @@ class BcolzDailyBarWriter:
         sessions = self._calendar.sessions_in_range(
             self._start_session, self._end_session
         )
+        # The tables store days as epoch seconds, so locate each asset's
+        # sessions on the same scale instead of building Timestamps per asset.
+        session_seconds = sessions.values.astype("datetime64[s]").view(np.int64)
 
         if assets is not None:
 
@@ -252,7 +268,7 @@ class BcolzDailyBarWriter:
                     yield asset_id, table
 
         for asset_id, table in iterator:
-            nrows = len(table)
+            nrows = len(table["day"])
             for column_name in columns:
                 if column_name == "id":
                     # We know what the content of this column is, so don't
@@ -265,9 +281,9 @@ class BcolzDailyBarWriter:
                 columns[column_name].append(table[column_name])
 
             if earliest_date is None:
-                earliest_date = table["day"][0]
+                earliest_date = int(table["day"][0])
             else:
-                earliest_date = min(earliest_date, table["day"][0])
+                earliest_date = min(earliest_date, int(table["day"][0]))
 
             # Bcolz doesn't support ints as keys in `attrs`, so convert
             # assets to strings for use as attr keys.
@@ -280,13 +296,16 @@ class BcolzDailyBarWriter:
             last_row[asset_key] = total_rows + nrows - 1
             total_rows += nrows
 
-            asset_first_day = pd.Timestamp(table["day"][0], unit="s").normalize()
-            asset_last_day = pd.Timestamp(table["day"][-1], unit="s").normalize()
+            days = table["day"]
+            first_day = int(days[0]) // SECONDS_PER_DAY * SECONDS_PER_DAY
+            last_day = int(days[-1]) // SECONDS_PER_DAY * SECONDS_PER_DAY
+            first_ix = session_seconds.searchsorted(first_day, side="left")
+            last_ix = session_seconds.searchsorted(last_day, side="right")
 
-            asset_sessions = sessions[
-                sessions.slice_indexer(asset_first_day, asset_last_day)
-            ]
-            if len(table) != len(asset_sessions):
+            if nrows != last_ix - first_ix:
+                asset_first_day = pd.Timestamp(first_day, unit="s")
+                asset_last_day = pd.Timestamp(last_day, unit="s")
+                asset_sessions = sessions[first_ix:last_ix]
 
                 missing_sessions = asset_sessions.difference(
                     pd.to_datetime(np.array(table["day"]), unit="s")
@@ -298,7 +317,7 @@ class BcolzDailyBarWriter:
                     .tolist()
                 )
                 raise AssertionError(
-                    f"Got {len(table)} rows for daily bars table with "
+                    f"Got {nrows} rows for daily bars table with "
                     f"first day={asset_first_day.date()}, last "
                     f"day={asset_last_day.date()}, expected {len(asset_sessions)} rows.\n"
                     f"Missing sessions: {missing_sessions}\nExtra sessions: {extra_sessions}"
@@ -309,7 +328,15 @@ class BcolzDailyBarWriter:
             # Calculate the number of trading days between the first date
             # in the stored data and the first date of **this** asset. This
             # offset used for output alignment by the reader.
-            calendar_offset[asset_key] = sessions.get_loc(asset_first_day)
+            if (
+                first_ix < len(session_seconds)
+                and session_seconds[first_ix] == first_day
+            ):
+                calendar_offset[asset_key] = int(first_ix)
+            else:
+                calendar_offset[asset_key] = sessions.get_loc(
+                    pd.Timestamp(first_day, unit="s")
+                )
 
         # This writes the table to disk.
         full_table = ctable(
@@ -338,13 +365,35 @@ class BcolzDailyBarWriter:
             # we already have a ctable so do nothing
             return raw_data
 
+        columns = self._to_columns(raw_data, invalid_data_behavior)
+        return ctable(columns=list(columns.values()), names=list(columns))
+
+    @expect_element(invalid_data_behavior={"warn", "raise", "ignore"})
+    def _to_columns(self, raw_data, invalid_data_behavior):
+        """Convert a frame of daily bars to a dict of the uint32 arrays that
+        are stored for it. A ctable is passed through unchanged.
+
+        ``write`` appends these arrays to the output table directly, rather
+        than compressing each asset into its own ctable and decompressing it
+        again.
+        """
+        if isinstance(raw_data, ctable):
+            return raw_data
+
         winsorise_uint32(raw_data, invalid_data_behavior, "volume", *OHLC)
-        processed = (raw_data[list(OHLC)] * 1000).round().astype("uint32")
+        ohlc = list(OHLC)
+        # Scale the prices in place in a single float64 block instead of
+        # allocating a new frame for each of the multiply, round and cast.
+        prices = raw_data[ohlc].to_numpy(dtype=np.float64, copy=True)
+        np.multiply(prices, 1000, out=prices)
+        np.round(prices, out=prices)
         dates = raw_data.index.values.astype("datetime64[s]")
         check_uint32_safe(dates.max().view(np.int64), "day")
-        processed["day"] = dates.astype("uint32")
-        processed["volume"] = raw_data.volume.astype("uint32")
-        return ctable.fromdataframe(processed)
+        return {
+            **{name: prices[:, i].astype("uint32") for i, name in enumerate(ohlc)},
+            "day": dates.astype("uint32"),
+            "volume": raw_data["volume"].to_numpy().astype("uint32"),
+        }
 
 
 class BcolzDailyBarReader(CurrencyAwareSessionBarReader):
@@ -425,6 +474,9 @@ class BcolzDailyBarReader(CurrencyAwareSessionBarReader):
         # Need to test keeping the entire array in memory for the course of a
         # process first.
         self._spot_cols = {}
+        # Map from sid to (end of the rows searched, last traded row or -1)
+        # for the latest get_last_traded_dt lookup of that sid.
+        self._last_traded_rows = {}
         self.PRICE_ADJUSTMENT_FACTOR = 0.001
         self._read_all_threshold = read_all_threshold
 
@@ -460,6 +512,14 @@ class BcolzDailyBarReader(CurrencyAwareSessionBarReader):
             for asset_id, start_index in self._table.attrs["first_row"].items()
         }
 
+    @lazyval
+    def _known_sids(self):
+        return np.fromiter(
+            self._first_rows.keys(),
+            dtype=np.int64,
+            count=len(self._first_rows),
+        )
+
     @lazyval
     def _last_rows(self):
         return {
@@ -582,29 +642,38 @@ class BcolzDailyBarReader(CurrencyAwareSessionBarReader):
         return col
 
     def get_last_traded_dt(self, asset, day):
+        try:
+            day_loc = self.sessions.get_loc(day)
+        except Exception:
+            return pd.NaT
+
+        first_row = self._first_rows[asset]
+        calendar_offset = self._calendar_offsets[asset]
+        # Days after the asset's last row search back from its last row, and
+        # days before its first row have nothing to search.
+        stop = min(first_row + day_loc - calendar_offset, self._last_rows[asset]) + 1
+        stop = max(stop, first_row)
+
+        # Simulations ask for successive days, so only the rows added since
+        # the last lookup for this sid need to be searched.
+        floor, last_traded = first_row, -1
+        previous = self._last_traded_rows.get(asset)
+        if previous is not None and previous[0] <= stop:
+            floor, last_traded = previous
+
+        # Walk the volume tape backwards by row position rather than by
+        # session, so each step is a single scalar read with no calendar
+        # lookups or exception handling.
         volumes = self._spot_col("volume")
-
-        search_day = day
-
-        while True:
-            try:
-                ix = self.sid_day_index(asset, search_day)
-            except NoDataBeforeDate:
-                return pd.NaT
-            except NoDataAfterDate:
-                prev_day_ix = self.sessions.get_loc(search_day) - 1
-                if prev_day_ix > -1:
-                    search_day = self.sessions[prev_day_ix]
-                continue
-            except NoDataOnDate:
-                return pd.NaT
+        for ix in range(stop - 1, floor - 1, -1):
             if volumes[ix] != 0:
-                return search_day
-            prev_day_ix = self.sessions.get_loc(search_day) - 1
-            if prev_day_ix > -1:
-                search_day = self.sessions[prev_day_ix]
-            else:
-                return pd.NaT
+                last_traded = ix
+                break
+        self._last_traded_rows[asset] = stop, last_traded
+
+        if last_traded == -1:
+            return pd.NaT
+        return self.sessions[calendar_offset + last_traded - first_row]
 
     def sid_day_index(self, sid, day):
         """
@@ -673,14 +742,9 @@ class BcolzDailyBarReader(CurrencyAwareSessionBarReader):
             return price
 
     def currency_codes(self, sids):
-        # XXX: This is pretty inefficient. This reader doesn't really support
-        # country codes, so we always either return USD or None if we don't
-        # know about the sid at all.
-        first_rows = self._first_rows
-        out = []
-        for sid in sids:
-            if sid in first_rows:
-                out.append("USD")
-            else:
-                out.append(None)
-        return np.array(out, dtype=object)
+        # This reader doesn't really support country codes, so we always either
+        # return USD or None if we don't know about the sid at all.
+        known = np.isin(np.asarray(sids, dtype=np.int64), self._known_sids)
+        out = np.full(len(known), None, dtype=object)
+        out[known] = "USD"
+        return out
@@ -1277,13 +1277,14 @@ class H5MinuteBarUpdateWriter:
     complevel : int, optional
         The HDF5 complevel, defaults to ``5``.
     complib : str, optional
-        The HDF5 complib, defaults to ``zlib``.
+        The HDF5 complib, defaults to ``blosc:lz4``, which decompresses
+        considerably faster than ``zlib`` at a similar compression ratio.
     """
 
     FORMAT_VERSION = 0
 
     _COMPLEVEL = 5
-    _COMPLIB = "zlib"
+    _COMPLIB = "blosc:lz4"
 
     def __init__(self, path, complevel=None, complib=None):
         self._complevel = complevel if complevel is not None else self._COMPLEVEL
@@ -1300,12 +1301,23 @@ class H5MinuteBarUpdateWriter:
             pricing data.
         """
 
+        # Append each sid's frame to the table in turn rather than building
+        # one concatenated copy of every update, upcasting each column to the
+        # dtype a concatenation would produce so that the appends agree.
+        dtypes = {}
+        for frame in frames.values():
+            for column, dtype in frame.dtypes.items():
+                dtypes[column] = np.result_type(dtypes.get(column, dtype), dtype)
+
         with HDFStore(
             self._path, "w", complevel=self._complevel, complib=self._complib
         ) as store:
-            data = pd.concat(frames, keys=frames.keys()).sort_index()
-            data.index.set_names(["sid", "date_time"], inplace=True)
-            store.append("updates", data)
+            for sid in sorted(frames):
+                data = frames[sid].sort_index().astype(dtypes, copy=False)
+                data.index = pd.MultiIndex.from_product(
+                    [[sid], data.index], names=["sid", "date_time"]
+                )
+                store.append("updates", data)
 
 
 class H5MinuteBarUpdateReader(MinuteBarUpdateReader):
@@ -1318,11 +1330,19 @@ class H5MinuteBarUpdateReader(MinuteBarUpdateReader):
     """
 
     def __init__(self, path):
-        # todo: error handling
-        self._df = pd.read_hdf(path).sort_index()
+        self._path = path
 
     def read(self, dts, sids):
-        df = self._df.loc[pd.IndexSlice[sids, dts], :]
+        # Push the sid and time bounds down into the table query so only the
+        # requested rows are read from disk, rather than the whole file.
+        sids = [int(sid) for sid in sids]
+        if not sids:
+            return
+        where = "sid in {} & date_time >= '{}' & date_time <= '{}'".format(
+            sids, dts[0], dts[-1]
+        )
+        df = pd.read_hdf(self._path, "updates", where=where).sort_index()
+        df = df.loc[pd.IndexSlice[sids, dts], :]
         for sid, data in df.groupby(level="sid"):
             data.index = data.index.droplevel("sid")
             yield sid, data
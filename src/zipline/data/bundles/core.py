@@ -583,18 +583,20 @@ def _make_bundle_core():
             ``keep_last``. This is a subclass of ``ValueError``.
         """
         try:
-            all_runs = sorted(
-                filter(
-                    complement(pth.hidden),
-                    os.listdir(pth.data_path([name], environ=environ)),
-                ),
-                key=from_bundle_ingest_dirname,
-            )
+            # Parse each run's timestamp once; it is needed both to order the
+            # runs and to test them against ``before`` and ``after``.
+            run_dts = {
+                run: from_bundle_ingest_dirname(run)
+                for run in os.listdir(pth.data_path([name], environ=environ))
+                if not pth.hidden(run)
+            }
         except OSError as e:
             if e.errno != errno.ENOENT:
                 raise
             raise UnknownBundle(name)
 
+        all_runs = sorted(run_dts, key=run_dts.__getitem__)
+
         if before is after is keep_last is None:
             raise BadClean(before, after, keep_last)
         if (before is not None or after is not None) and keep_last is not None:
@@ -603,7 +605,7 @@ def _make_bundle_core():
         if keep_last is None:
 
             def should_clean(name):
-                dt = from_bundle_ingest_dirname(name)
+                dt = run_dts[name]
                 return (before is not None and dt < before) or (
                     after is not None and dt > after
                 )
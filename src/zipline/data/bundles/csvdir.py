@@ -1,6 +1,8 @@
 """
 Module for building a complete dataset from local directory with csv files.
 """
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import os
 import sys
 
@@ -17,6 +19,12 @@ handler = logging.StreamHandler()
 logger = logging.getLogger(__name__)
 logger.handlers.append(handler)
 
+# Parse the known numeric columns straight to float64, the dtype the bar
+# writers convert from, rather than inferring them (and possibly ints) per file.
+CSV_DTYPES = dict.fromkeys(
+    ["open", "high", "low", "close", "volume", "dividend", "split"], np.float64
+)
+
 
 def csvdir_equities(tframes=None, csvdir=None):
     """
@@ -132,25 +140,22 @@ def csvdir_bundle(
                 "'daily' and 'minute' directories " "not found in '%s'" % csvdir
             )
 
-    divs_splits = {
-        "divs": pd.DataFrame(
-            columns=[
-                "sid",
-                "amount",
-                "ex_date",
-                "record_date",
-                "declared_date",
-                "pay_date",
-            ]
-        ),
-        "splits": pd.DataFrame(columns=["sid", "ratio", "effective_date"]),
-    }
+    # (sid, series) pairs of the split ratios and dividend amounts found in
+    # each symbol's file, stacked into single frames once all are read.
+    divs_splits = {"divs": [], "splits": []}
     for tframe in tframes:
         ddir = os.path.join(csvdir, tframe)
 
-        symbols = sorted(
-            item.split(".csv")[0] for item in os.listdir(ddir) if ".csv" in item
-        )
+        # Scan the directory once, collecting each symbol's (possibly
+        # compressed) csv file name.
+        # NOTE: if there are duplicates the latest file found is used
+        with os.scandir(ddir) as entries:
+            fnames = {
+                entry.name.split(".csv")[0]: entry.name
+                for entry in entries
+                if ".csv" in entry.name and entry.is_file()
+            }
+        symbols = sorted(fnames)
         if not symbols:
             raise ValueError("no <symbol>.csv* files found in %s" % ddir)
 
@@ -160,7 +165,7 @@ def csvdir_bundle(
             ("auto_close_date", "datetime64[ns]"),
             ("symbol", "object"),
         ]
-        metadata = pd.DataFrame(np.empty(len(symbols), dtype=dtype))
+        metadata = np.empty(len(symbols), dtype=dtype)
 
         if tframe == "minute":
             writer = minute_bar_writer
@@ -168,10 +173,12 @@ def csvdir_bundle(
             writer = daily_bar_writer
 
         writer.write(
-            _pricing_iter(ddir, symbols, metadata, divs_splits, show_progress),
+            _pricing_iter(ddir, symbols, fnames, metadata, divs_splits, show_progress),
             show_progress=show_progress,
         )
 
+        metadata = pd.DataFrame(metadata)
+
         # Hardcode the exchange to "CSVDIR" for all assets and (elsewhere)
         # register "CSVDIR" to resolve to the NYSE calendar, because these
         # are all equities and thus can use the NYSE calendar.
@@ -179,73 +186,99 @@ def csvdir_bundle(
 
         asset_db_writer.write(equities=metadata)
 
-        divs_splits["divs"]["sid"] = divs_splits["divs"]["sid"].astype(int)
-        divs_splits["splits"]["sid"] = divs_splits["splits"]["sid"].astype(int)
-        adjustment_writer.write(
-            splits=divs_splits["splits"], dividends=divs_splits["divs"]
-        )
+        # The adjustment writer treats a missing frame as an empty table, so
+        # only build the frames when the files had any adjustments.
+        splits = _stack_by_sid(divs_splits["splits"], "effective_date", "ratio")
+        if splits is not None:
+            splits["ratio"] = 1.0 / splits["ratio"]
+
+        divs = _stack_by_sid(divs_splits["divs"], "ex_date", "amount")
+        if divs is not None:
+            divs["record_date"] = divs["declared_date"] = divs["pay_date"] = pd.NaT
+
+        adjustment_writer.write(splits=splits, dividends=divs)
+
 
+def _stack_by_sid(adjustments, date_column, value_column):
+    """Stack (sid, series) pairs into a single frame with one row per
+    adjustment and columns ``sid``, ``date_column`` and ``value_column``, or
+    None if there are no adjustments.
+    """
+    if not adjustments:
+        return None
+
+    # Concatenate the raw arrays directly; ``pd.concat`` would build and then
+    # flatten a MultiIndex out of many tiny series.
+    sids, values = zip(*adjustments)
+    return pd.DataFrame(
+        {
+            "sid": np.repeat(sids, [len(value) for value in values]),
+            date_column: np.concatenate([value.index.values for value in values]),
+            value_column: np.concatenate([value.values for value in values]),
+        }
+    )
+
+
+def _read_csvs(csvdir, symbols, fnames, max_workers=8):
+    """Read the csv file of each symbol on a thread pool, yielding the frames
+    in ``symbols`` order with at most ``max_workers`` reads in flight.
+    """
 
-def _pricing_iter(csvdir, symbols, metadata, divs_splits, show_progress):
+    def read(symbol):
+        # NOTE: read_csv can also read compressed csv files
+        dfr = pd.read_csv(
+            os.path.join(csvdir, fnames[symbol]),
+            parse_dates=[0],
+            index_col=0,
+            dtype=CSV_DTYPES,
+        )
+        # Files are usually written in date order already; sort_index would
+        # still copy the whole frame, so only sort the ones that need it.
+        if dfr.index.is_monotonic_increasing:
+            return dfr
+        return dfr.sort_index()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque()
+        for symbol in symbols:
+            pending.append(executor.submit(read, symbol))
+            if len(pending) >= max_workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _pricing_iter(csvdir, symbols, fnames, metadata, divs_splits, show_progress):
     with maybe_show_progress(
         symbols, show_progress, label="Loading custom pricing data: "
     ) as it:
-        # using scandir instead of listdir can be faster
-        files = os.scandir(csvdir)
-        # building a dictionary of filenames
-        # NOTE: if there are duplicates it will arbitrarily pick the latest found
-        fnames = {f.name.split(".")[0]: f.name for f in files if f.is_file()}
-
-        for sid, symbol in enumerate(it):
+        frames = _read_csvs(csvdir, symbols, fnames)
+        for sid, (symbol, dfr) in enumerate(zip(it, frames)):
             logger.debug(f"{symbol}: sid {sid}")
-            fname = fnames.get(symbol, None)
-
-            if fname is None:
-                raise ValueError(f"{symbol}.csv file is not in {csvdir}")
-
-            # NOTE: read_csv can also read compressed csv files
-            dfr = pd.read_csv(
-                os.path.join(csvdir, fname),
-                parse_dates=[0],
-                index_col=0,
-            ).sort_index()
 
             start_date = dfr.index[0]
             end_date = dfr.index[-1]
 
             # The auto_close date is the day after the last trade.
             ac_date = end_date + pd.Timedelta(days=1)
-            metadata.iloc[sid] = start_date, end_date, ac_date, symbol
+            metadata[sid] = (
+                start_date.to_datetime64(),
+                end_date.to_datetime64(),
+                ac_date.to_datetime64(),
+                symbol,
+            )
 
             if "split" in dfr.columns:
-                tmp = 1.0 / dfr[dfr["split"] != 1.0]["split"]
-                split = pd.DataFrame(
-                    data=tmp.index.tolist(), columns=["effective_date"]
-                )
-                split["ratio"] = tmp.tolist()
-                split["sid"] = sid
-
-                splits = divs_splits["splits"]
-                index = pd.Index(
-                    range(splits.shape[0], splits.shape[0] + split.shape[0])
-                )
-                split.set_index(index, inplace=True)
-                divs_splits["splits"] = pd.concat([splits, split], axis=0)
+                split = dfr["split"]
+                split = split[split != 1.0]
+                if not split.empty:
+                    divs_splits["splits"].append((sid, split))
 
             if "dividend" in dfr.columns:
-                # ex_date   amount  sid record_date declared_date pay_date
-                tmp = dfr[dfr["dividend"] != 0.0]["dividend"]
-                div = pd.DataFrame(data=tmp.index.tolist(), columns=["ex_date"])
-                div["record_date"] = pd.NaT
-                div["declared_date"] = pd.NaT
-                div["pay_date"] = pd.NaT
-                div["amount"] = tmp.tolist()
-                div["sid"] = sid
-
-                divs = divs_splits["divs"]
-                ind = pd.Index(range(divs.shape[0], divs.shape[0] + div.shape[0]))
-                div.set_index(ind, inplace=True)
-                divs_splits["divs"] = pd.concat([divs, div], axis=0)
+                dividend = dfr["dividend"]
+                dividend = dividend[dividend != 0.0]
+                if not dividend.empty:
+                    divs_splits["divs"].append((sid, dividend))
 
             yield sid, dfr
 
@@ -1,8 +1,11 @@
 """
 Module for building a complete daily dataset from Quandl's WIKI dataset.
 """
-from io import BytesIO
+from importlib.util import find_spec
+import os
 import tarfile
+from tempfile import SpooledTemporaryFile
+import time
 from zipfile import ZipFile
 
 from click import progressbar
@@ -10,7 +13,10 @@ import logging
 import pandas as pd
 import requests
 from urllib.parse import urlencode
+from zipline.utils.cache import dataframe_cache
 from zipline.utils.calendar_utils import register_calendar_alias
+from zipline.utils.functional import prefetch
+import zipline.utils.paths as pth
 
 from . import core as bundles
 import numpy as np
@@ -18,7 +24,18 @@ import numpy as np
 log = logging.getLogger(__name__)
 
 ONE_MEGABYTE = 1024 * 1024
+MAX_RETRY_DELAY = 10
+DOWNLOAD_SPOOL_SIZE = 64 * ONE_MEGABYTE
+DEFAULT_DOWNLOAD_CACHE_MAX_AGE = "0"
+PRICING_PREFETCH_SIZE = 32
 QUANDL_DATA_URL = "https://www.quandl.com/api/v3/datatables/WIKI/PRICES.csv?"
+# pyarrow is optional; when it is installed pandas can use its multithreaded
+# CSV parser for the (multi-GB) WIKI Prices table.
+CSV_ENGINE = "pyarrow" if find_spec("pyarrow") is not None else "c"
+
+# Downloads share one session so that retries reuse the pooled connection
+# instead of paying for a new TCP and TLS handshake each time.
+_SESSION = requests.Session()
 
 
 def format_metadata_url(api_key):
@@ -37,23 +54,34 @@ def load_data_table(file, index_col, show_progress=False):
         with zip_file.open(wiki_prices) as table_file:
             if show_progress:
                 log.info("Parsing raw data.")
+            numeric_columns = [
+                "open",
+                "high",
+                "low",
+                "close",
+                "volume",
+                "ex-dividend",
+                "split_ratio",
+            ]
+            # A few thousand tickers repeat across millions of rows, so they
+            # are parsed straight into a categorical instead of one string
+            # object per row; the numeric columns are parsed as float64 up
+            # front rather than inferred per column.
             data_table = pd.read_csv(
                 table_file,
                 parse_dates=["date"],
-                index_col=index_col,
-                usecols=[
-                    "ticker",
-                    "date",
-                    "open",
-                    "high",
-                    "low",
-                    "close",
-                    "volume",
-                    "ex-dividend",
-                    "split_ratio",
-                ],
+                dtype={
+                    "ticker": "category",
+                    **dict.fromkeys(numeric_columns, np.float64),
+                },
+                usecols=["ticker", "date", *numeric_columns],
+                engine=CSV_ENGINE,
             )
 
+    # Set the index after parsing: the pyarrow engine mishandles index_col
+    # together with per-column dtypes.
+    if index_col is not None:
+        data_table.set_index(index_col, inplace=True)
     data_table.rename(
         columns={
             "ticker": "symbol",
@@ -65,16 +93,36 @@ def load_data_table(file, index_col, show_progress=False):
     return data_table
 
 
+def _is_client_error(exc):
+    """Whether ``exc`` is an HTTP 4xx response other than a rate limit."""
+    # requests errors carry the response, urllib ones (from read_csv) the code.
+    status = getattr(getattr(exc, "response", None), "status_code", None)
+    if status is None:
+        status = getattr(exc, "code", None)
+    return isinstance(status, int) and 400 <= status < 500 and status != 429
+
+
 def fetch_data_table(api_key, show_progress, retries):
     """Fetch WIKI Prices data table from Quandl"""
-    for _ in range(retries):
+    table_url = None
+    for attempt in range(retries):
+        if attempt:
+            # Back off exponentially (1, 2, 4, 8, 10, 10, ... seconds) so a
+            # struggling server isn't hit again right away.
+            time.sleep(min(MAX_RETRY_DELAY, 2 ** (attempt - 1)))
+        # A retry goes straight back to the file link from an earlier attempt
+        # instead of asking the API for the metadata again.
+        reused_table_url = table_url is not None
         try:
-            if show_progress:
-                log.info("Downloading WIKI metadata.")
+            if not reused_table_url:
+                if show_progress:
+                    log.info("Downloading WIKI metadata.")
 
-            metadata = pd.read_csv(format_metadata_url(api_key))
-            # Extract link from metadata and download zip file.
-            table_url = metadata.loc[0, "file.link"]
+                metadata = pd.read_csv(
+                    format_metadata_url(api_key), usecols=["file.link"]
+                )
+                # Extract link from metadata and download zip file.
+                table_url = metadata.loc[0, "file.link"]
             if show_progress:
                 raw_file = download_with_progress(
                     table_url,
@@ -84,13 +132,22 @@ def fetch_data_table(api_key, show_progress, retries):
             else:
                 raw_file = download_without_progress(table_url)
 
-            return load_data_table(
-                file=raw_file,
-                index_col=None,
-                show_progress=show_progress,
-            )
+            with raw_file:
+                return load_data_table(
+                    file=raw_file,
+                    index_col=None,
+                    show_progress=show_progress,
+                )
 
-        except Exception:
+        except Exception as exc:
+            if _is_client_error(exc):
+                if not reused_table_url:
+                    # The request itself was rejected (e.g. a bad API key or
+                    # a retired table), so retrying it can't succeed.
+                    raise
+                # The file link from an earlier attempt has likely expired;
+                # ask for a fresh one.
+                table_url = None
             log.exception("Exception raised reading Quandl data. Retrying.")
 
     else:
@@ -99,16 +156,49 @@ def fetch_data_table(api_key, show_progress, retries):
         )
 
 
+def fetch_cached_data_table(environ, api_key, show_progress):
+    """Fetch the WIKI Prices data table, reusing the table downloaded by an
+    earlier ingest if it is younger than ``QUANDL_CACHE_MAX_AGE``.
+
+    ``QUANDL_CACHE_MAX_AGE`` is anything ``pd.Timedelta`` understands. It
+    defaults to ``0``, which always downloads a fresh table and keeps no copy
+    of it. A kept table is deleted once it is older than the maximum age.
+    """
+    downloads = dataframe_cache(
+        pth.cache_path(["quandl"], environ=environ),
+        clean_on_failure=False,
+    )
+    max_age = pd.Timedelta(
+        environ.get("QUANDL_CACHE_MAX_AGE", DEFAULT_DOWNLOAD_CACHE_MAX_AGE)
+    )
+    cutoff = pd.Timestamp.now(tz="UTC") - max_age
+    if pth.modified_since(os.path.join(downloads.path, "raw_data"), cutoff):
+        return downloads["raw_data"]
+
+    # The table is several GB, so don't leave an expired copy on disk.
+    try:
+        del downloads["raw_data"]
+    except KeyError:
+        pass
+
+    raw_data = fetch_data_table(
+        api_key, show_progress, environ.get("QUANDL_DOWNLOAD_ATTEMPTS", 5)
+    )
+    if max_age > pd.Timedelta(0):
+        downloads["raw_data"] = raw_data
+    return raw_data
+
+
 def gen_asset_metadata(data, show_progress):
     if show_progress:
         log.info("Generating asset metadata.")
 
-    data = data.groupby(by="symbol").agg({"date": [np.min, np.max]})
-    data.reset_index(inplace=True)
-    data["start_date"] = data.date[np.min.__name__]
-    data["end_date"] = data.date[np.max.__name__]
-    del data["date"]
-    data.columns = data.columns.get_level_values(0)
+    data = (
+        data.groupby(by="symbol", observed=True)["date"]
+        .agg(start_date="min", end_date="max")
+        .reset_index()
+    )
+    data["symbol"] = data["symbol"].astype(object)
 
     data["exchange"] = "QUANDL"
     data["auto_close_date"] = data["end_date"].values + pd.Timedelta(days=1)
@@ -148,11 +238,34 @@ def parse_dividends(data, show_progress):
 
 
 def parse_pricing_and_vol(data, sessions, symbol_map):
-    for asset_id, symbol in symbol_map.items():
-        asset_data = (
-            data.xs(symbol, level=1).reindex(sessions.tz_localize(None)).fillna(0.0)
+    # Every asset is aligned to the same sessions, so build the naive session
+    # index once rather than once per asset.
+    sessions = sessions.tz_localize(None)
+    # Only the pricing columns are written as bars; pull them out, fill the
+    # missing values and find each row's session once for the whole table.
+    columns = ["open", "high", "low", "close", "volume"]
+    values = data[columns].to_numpy(np.float64)
+    values[np.isnan(values)] = 0.0
+    positions = sessions.get_indexer(data.index.get_level_values("date"))
+    # The table is sorted by (symbol, date), so each symbol's rows are one
+    # contiguous block; find all the block boundaries in a single pass
+    # instead of looking every symbol up in the MultiIndex.
+    symbols = data.index.get_level_values("symbol")
+    starts = np.flatnonzero(symbols[1:] != symbols[:-1]) + 1
+    bounds = dict(
+        zip(
+            symbols[np.r_[0, starts]],
+            zip(np.r_[0, starts], np.r_[starts, len(symbols)]),
         )
-        yield asset_id, asset_data
+    )
+    for asset_id, symbol in symbol_map.items():
+        start, stop = bounds[symbol]
+        asset_positions = positions[start:stop]
+        in_sessions = asset_positions >= 0
+        # Sessions the asset has no row for are written as zeros.
+        asset_values = np.zeros((len(sessions), len(columns)))
+        asset_values[asset_positions[in_sessions]] = values[start:stop][in_sessions]
+        yield asset_id, pd.DataFrame(asset_values, index=sessions, columns=columns)
 
 
 @bundles.register("quandl")
@@ -181,9 +294,7 @@ def quandl_bundle(
             "Please set your QUANDL_API_KEY environment variable and retry."
         )
 
-    raw_data = fetch_data_table(
-        api_key, show_progress, environ.get("QUANDL_DOWNLOAD_ATTEMPTS", 5)
-    )
+    raw_data = fetch_cached_data_table(environ, api_key, show_progress)
     asset_metadata = gen_asset_metadata(raw_data[["symbol", "date"]], show_progress)
 
     exchanges = pd.DataFrame(
@@ -195,34 +306,40 @@ def quandl_bundle(
     symbol_map = asset_metadata.symbol
     sessions = calendar.sessions_in_range(start_session, end_session)
 
-    raw_data.set_index(["date", "symbol"], inplace=True)
+    # Sort once by (symbol, date) so each asset's rows form a contiguous block
+    # that can be sliced out directly instead of scanned for.
+    raw_data.set_index(["symbol", "date"], inplace=True)
+    raw_data.sort_index(inplace=True)
+    # Build the next assets' bars on a background thread while the writer
+    # compresses the current one.
     daily_bar_writer.write(
-        parse_pricing_and_vol(raw_data, sessions, symbol_map),
+        prefetch(
+            parse_pricing_and_vol(raw_data, sessions, symbol_map),
+            maxsize=PRICING_PREFETCH_SIZE,
+        ),
         show_progress=show_progress,
     )
 
+    # Few rows carry a split or dividend: narrow the table to those rows in a
+    # single pass and only look up the sids for them.
     raw_data.reset_index(inplace=True)
-    raw_data["symbol"] = raw_data["symbol"].astype("category")
-    raw_data["sid"] = raw_data.symbol.cat.codes
+    actions = raw_data.loc[
+        (raw_data.split_ratio != 1) | (raw_data.ex_dividend != 0),
+        ["symbol", "date", "split_ratio", "ex_dividend"],
+    ]
+    # Look each distinct symbol up once and broadcast the sids back out over
+    # the rows through the symbol codes (the categorical's own codes when
+    # the ticker column was parsed as one).
+    codes, symbols = pd.factorize(actions["symbol"])
+    sid_by_symbol = pd.Series(symbol_map.index, index=symbol_map.values)
+    actions.insert(0, "sid", sid_by_symbol.reindex(symbols).to_numpy()[codes])
     adjustment_writer.write(
         splits=parse_splits(
-            raw_data[
-                [
-                    "sid",
-                    "date",
-                    "split_ratio",
-                ]
-            ].loc[raw_data.split_ratio != 1],
+            actions.loc[actions.split_ratio != 1, ["sid", "date", "split_ratio"]],
             show_progress=show_progress,
         ),
         dividends=parse_dividends(
-            raw_data[
-                [
-                    "sid",
-                    "date",
-                    "ex_dividend",
-                ]
-            ].loc[raw_data.ex_dividend != 0],
+            actions.loc[actions.ex_dividend != 0, ["sid", "date", "ex_dividend"]],
             show_progress=show_progress,
         ),
     )
@@ -244,14 +361,14 @@ def download_with_progress(url, chunk_size, **progress_kwargs):
 
     Returns
     -------
-    data : BytesIO
-        A BytesIO containing the downloaded data.
+    data : SpooledTemporaryFile
+        A temporary file containing the downloaded data.
     """
-    resp = requests.get(url, stream=True)
+    resp = _SESSION.get(url, stream=True)
     resp.raise_for_status()
 
     total_size = int(resp.headers["content-length"])
-    data = BytesIO()
+    data = _download_file()
     with progressbar(length=total_size, **progress_kwargs) as pbar:
         for chunk in resp.iter_content(chunk_size=chunk_size):
             data.write(chunk)
@@ -263,7 +380,8 @@ def download_with_progress(url, chunk_size, **progress_kwargs):
 
 def download_without_progress(url):
     """
-    Download data from a URL, returning a BytesIO containing the loaded data.
+    Download data from a URL, returning a temporary file containing the loaded
+    data.
 
     Parameters
     ----------
@@ -272,12 +390,27 @@ def download_without_progress(url):
 
     Returns
     -------
-    data : BytesIO
-        A BytesIO containing the downloaded data.
+    data : SpooledTemporaryFile
+        A temporary file containing the downloaded data.
     """
-    resp = requests.get(url)
+    resp = _SESSION.get(url, stream=True)
     resp.raise_for_status()
-    return BytesIO(resp.content)
+
+    data = _download_file()
+    for chunk in resp.iter_content(chunk_size=ONE_MEGABYTE):
+        data.write(chunk)
+
+    data.seek(0)
+    return data
+
+
+def _download_file():
+    """A file to stream a download into.
+
+    Small downloads stay in memory; large ones, like the full WIKI table,
+    are spilled to disk instead of being held in memory as a whole.
+    """
+    return SpooledTemporaryFile(max_size=DOWNLOAD_SPOOL_SIZE)
 
 
 QUANTOPIAN_QUANDL_URL = "https://s3.amazonaws.com/quantopian-public-zipline-data/quandl"
@@ -306,7 +439,7 @@ def quantopian_quandl_bundle(
     else:
         data = download_without_progress(QUANTOPIAN_QUANDL_URL)
 
-    with tarfile.open("r", fileobj=data) as tar:
+    with data, tarfile.open("r", fileobj=data) as tar:
         if show_progress:
             log.info("Writing data to %s.", output_dir)
         tar.extractall(output_dir)
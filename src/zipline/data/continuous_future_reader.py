@@ -29,22 +29,11 @@ class ContinuousFutureSessionBarReader(SessionBarReader):
             (minutes in range, sids) with a dtype of float64, containing the
             values for the respective field over start and end dt range.
         """
-        rolls_by_asset = {}
-        for asset in assets:
-            rf = self._roll_finders[asset.roll_style]
-            rolls_by_asset[asset] = rf.get_rolls(
-                asset.root_symbol, start_date, end_date, asset.offset
-            )
-
-        num_sessions = len(
-            self.trading_calendar.sessions_in_range(start_date, end_date)
-        )
-        shape = num_sessions, len(assets)
-
-        results = []
-
         tc = self._bar_reader.trading_calendar
         sessions = tc.sessions_in_range(start_date, end_date)
+        shape = len(sessions), len(assets)
+
+        results = []
 
         # Get partitions
         partitions_by_asset = {}
@@ -52,7 +41,8 @@ class ContinuousFutureSessionBarReader(SessionBarReader):
             partitions = []
             partitions_by_asset[asset] = partitions
 
-            rolls = rolls_by_asset[asset]
+            rf = self._roll_finders[asset.roll_style]
+            rolls = rf.get_rolls(asset.root_symbol, start_date, end_date, asset.offset)
             start = start_date
 
             for roll in rolls:
@@ -76,21 +66,26 @@ class ContinuousFutureSessionBarReader(SessionBarReader):
                 out = np.full(shape, np.nan)
             else:
                 out = np.zeros(shape, dtype=np.int64)
+            results.append(out)
 
-            for i, asset in enumerate(assets):
-                partitions = partitions_by_asset[asset]
+        # Read every requested field of a partition in a single call rather
+        # than once per field.
+        bar_columns = [column for column in columns if column != "sid"]
+        for i, asset in enumerate(assets):
+            partitions = partitions_by_asset[asset]
 
-                for sid, start, end, start_loc, end_loc in partitions:
+            for sid, start, end, start_loc, end_loc in partitions:
+                if bar_columns:
+                    bars = iter(
+                        self._bar_reader.load_raw_arrays(bar_columns, start, end, [sid])
+                    )
+                for column, out in zip(columns, results):
                     if column != "sid":
-                        result = self._bar_reader.load_raw_arrays(
-                            [column], start, end, [sid]
-                        )[0][:, 0]
+                        result = next(bars)[:, 0]
                     else:
                         result = int(sid)
                     out[start_loc : end_loc + 1, i] = result
 
-            results.append(out)
-
         return results
 
     @property
@@ -216,18 +211,10 @@ class ContinuousFutureMinuteBarReader(SessionBarReader):
             (minutes in range, sids) with a dtype of float64, containing the
             values for the respective field over start and end dt range.
         """
-        rolls_by_asset = {}
-
         tc = self.trading_calendar
         start_session = tc.minute_to_session(start_date)
         end_session = tc.minute_to_session(end_date)
 
-        for asset in assets:
-            rf = self._roll_finders[asset.roll_style]
-            rolls_by_asset[asset] = rf.get_rolls(
-                asset.root_symbol, start_session, end_session, asset.offset
-            )
-
         sessions = tc.sessions_in_range(
             start_date.normalize().tz_localize(None),
             end_date.normalize().tz_localize(None),
@@ -244,7 +231,10 @@ class ContinuousFutureMinuteBarReader(SessionBarReader):
         for asset in assets:
             partitions = []
             partitions_by_asset[asset] = partitions
-            rolls = rolls_by_asset[asset]
+            rf = self._roll_finders[asset.roll_style]
+            rolls = rf.get_rolls(
+                asset.root_symbol, start_session, end_session, asset.offset
+            )
             start = start_date
             for roll in rolls:
                 sid, roll_date = roll
@@ -266,17 +256,22 @@ class ContinuousFutureMinuteBarReader(SessionBarReader):
                 out = np.full(shape, np.nan)
             else:
                 out = np.zeros(shape, dtype=np.uint32)
-            for i, asset in enumerate(assets):
-                partitions = partitions_by_asset[asset]
-                for sid, start, end, start_loc, end_loc in partitions:
+            results.append(out)
+
+        bar_columns = [column for column in columns if column != "sid"]
+        for i, asset in enumerate(assets):
+            partitions = partitions_by_asset[asset]
+            for sid, start, end, start_loc, end_loc in partitions:
+                if bar_columns:
+                    bars = iter(
+                        self._bar_reader.load_raw_arrays(bar_columns, start, end, [sid])
+                    )
+                for column, out in zip(columns, results):
                     if column != "sid":
-                        result = self._bar_reader.load_raw_arrays(
-                            [column], start, end, [sid]
-                        )[0][:, 0]
+                        result = next(bars)[:, 0]
                     else:
                         result = int(sid)
                     out[start_loc : end_loc + 1, i] = result
-            results.append(out)
         return results
 
     @property
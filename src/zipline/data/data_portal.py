@@ -344,18 +344,9 @@ class DataPortal:
         # Break the source_df up into one dataframe per sid.  This lets
         # us (more easily) calculate accurate start/end dates for each sid,
         # de-dup data, and expand the data to fit the backtest start/end date.
-        grouped_by_sid = source_df.groupby(["sid"])
-        group_names = grouped_by_sid.groups.keys()
-        group_dict = {}
-        for group_name in group_names:
-            group_dict[group_name] = grouped_by_sid.get_group(group_name)
-
-        # This will be the dataframe which we query to get fetcher assets at
-        # any given time. Get's overwritten every time there's a new fetcher
-        # call
-        extra_source_df = pd.DataFrame()
-
-        for identifier, df in group_dict.items():
+        # A single groupby pass hands us every sid's rows in turn.
+        extra_source_frames = []
+        for identifier, df in source_df.groupby("sid"):
             # Since we know this df only contains a single sid, we can safely
             # de-dupe by the index (dt). If minute granularity, will take the
             # last data point on any given day
@@ -371,11 +362,16 @@ class DataPortal:
 
                 self._augmented_sources_map[col_name][identifier] = df
 
-            # Append to extra_source_df the reindexed dataframe for the single
-            # sid
-            extra_source_df = pd.concat([extra_source_df, df], axis=0)
+            extra_source_frames.append(df)
 
-        self._extra_source_df = extra_source_df
+        # This will be the dataframe which we query to get fetcher assets at
+        # any given time. Get's overwritten every time there's a new fetcher
+        # call. The reindexed single sid frames are stacked once at the end
+        # rather than appended to it one at a time.
+        if extra_source_frames:
+            self._extra_source_df = pd.concat(extra_source_frames, axis=0)
+        else:
+            self._extra_source_df = pd.DataFrame()
 
     def _get_pricing_reader(self, data_frequency):
         return self._pricing_readers[data_frequency]
@@ -948,20 +944,18 @@ class DataPortal:
             df.iloc[0, assets_with_leading_nan] = np.array(
                 initial_values, dtype=np.float64
             )
-            df.fillna(method="ffill", inplace=True)
+            df.ffill(inplace=True)
 
             # forward-filling will incorrectly produce values after the end of
             # an asset's lifetime, so write NaNs back over the asset's
             # end_date.
             normed_index = df.index.normalize()
-            for asset in df.columns:
-                if history_end >= asset.end_date.tz_localize(history_end.tzinfo):
-                    # if the window extends past the asset's end date, set
-                    # all post-end-date values to NaN in that asset's series
-                    df.loc[
-                        normed_index > asset.end_date.tz_localize(normed_index.tz),
-                        asset,
-                    ] = nan
+            end_dates = pd.DatetimeIndex(
+                [asset.end_date for asset in df.columns]
+            ).tz_localize(normed_index.tz)
+            past_end_date = normed_index.values[:, None] > end_dates.values
+            if past_end_date.any():
+                df.mask(past_end_date, inplace=True)
         return df
 
     def _get_minute_window_data(self, assets, field, minutes_for_window):
@@ -349,7 +349,10 @@ class HDF5DailyBarWriter:
         # Add id to the index, so the frame is indexed by (date, id).
         ohlcv_frame.set_index(sid_ix, append=True, inplace=True)
 
-        frames = {field: ohlcv_frame[field].unstack() for field in FIELDS}
+        # Pivot all fields at once into a (date) x (field, id) frame rather
+        # than unstacking each field separately.
+        wide = ohlcv_frame[list(FIELDS)].unstack()
+        frames = {field: wide[field].copy() for field in FIELDS}
 
         return self.write(
             country_code=country_code,
@@ -814,14 +817,16 @@ class HDF5DailyBarReader(CurrencyAwareSessionBarReader):
         dt_limit_ix = self.dates.searchsorted(dt.asm8, side="right")
 
         # Get the indices of all dates with nonzero volume.
-        nonzero_volume_ixs = np.ravel(
-            np.nonzero(self._country_group[DATA][VOLUME][sid_ix, :dt_limit_ix])
+        nonzero_volume_ixs = np.flatnonzero(
+            self._country_group[DATA][VOLUME][sid_ix, :dt_limit_ix]
         )
 
         if len(nonzero_volume_ixs) == 0:
             return pd.NaT
 
-        return pd.Timestamp(self.dates[nonzero_volume_ixs][-1])
+        # Only the last traded date is needed, so look up that single date
+        # rather than gathering every traded date first.
+        return pd.Timestamp(self.dates[nonzero_volume_ixs[-1]])
 
 
 class MultiCountryDailyBarReader(CurrencyAwareSessionBarReader):
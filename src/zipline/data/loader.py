@@ -12,6 +12,8 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import os
 
 import pandas as pd
@@ -25,13 +27,17 @@ def load_prices_from_csv(filepath, identifier_col, tz="UTC"):
 
 
 def load_prices_from_csv_folder(folderpath, identifier_col, tz="UTC"):
-    data = None
-    for file in os.listdir(folderpath):
-        if ".csv" not in file:
-            continue
-        raw = load_prices_from_csv(os.path.join(folderpath, file), identifier_col, tz)
-        if data is None:
-            data = raw
-        else:
-            data = pd.concat([data, raw], axis=1)
-    return data
+    paths = [
+        os.path.join(folderpath, file)
+        for file in os.listdir(folderpath)
+        if ".csv" in file
+    ]
+    if not paths:
+        return None
+
+    # The files are independent, so read them concurrently and join them
+    # once instead of growing the frame one file at a time.
+    read = partial(load_prices_from_csv, identifier_col=identifier_col, tz=tz)
+    with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+        frames = list(executor.map(read, paths))
+    return pd.concat(frames, axis=1)
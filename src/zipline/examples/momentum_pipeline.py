@@ -32,8 +32,12 @@ def rebalance(context, data):
     pipeline_data = context.pipeline_data
     all_assets = pipeline_data.index
 
-    longs = all_assets[pipeline_data.longs]
-    shorts = all_assets[pipeline_data.shorts]
+    # Index positionally with the raw boolean arrays rather than aligning the
+    # columns against the index as Series.
+    longs_mask = pipeline_data["longs"].to_numpy()
+    shorts_mask = pipeline_data["shorts"].to_numpy()
+    longs = all_assets[longs_mask]
+    shorts = all_assets[shorts_mask]
 
     record(universe_size=len(all_assets))
 
@@ -46,12 +50,15 @@ def rebalance(context, data):
         order_target_percent(asset, -one_third)
 
     # Remove any assets that should no longer be in our portfolio.
-    portfolio_assets = longs.union(shorts)
+    portfolio_assets = set(all_assets[longs_mask | shorts_mask])
     positions = context.portfolio.positions
-    for asset in positions.keys() - set(portfolio_assets):
-        # This will fail if the asset was removed from our portfolio because it
-        # was delisted.
-        if data.can_trade(asset):
+    stale_assets = list(positions.keys() - portfolio_assets)
+    if stale_assets:
+        # Check tradability for all of the stale assets in one call. Assets
+        # removed from our portfolio because they were delisted can't be
+        # traded.
+        tradable = data.can_trade(stale_assets)
+        for asset in tradable.index[tradable.to_numpy()]:
             order_target_percent(asset, 0)
 
 
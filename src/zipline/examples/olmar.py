@@ -46,16 +46,11 @@ def handle_data(algo, data):
         algo.init = False
         return
 
-    m = algo.m
-
-    x_tilde = np.zeros(m)
-
     # find relative moving average price for each asset
     mavgs = data.history(algo.sids, "price", algo.window_length, "1d").mean()
-    for i, sid in enumerate(algo.sids):
-        price = data.current(sid, "price")
-        # Relative mean deviation
-        x_tilde[i] = mavgs[sid] / price
+    prices = data.current(algo.sids, "price")
+    # Relative mean deviation
+    x_tilde = mavgs[algo.sids].to_numpy() / prices[algo.sids].to_numpy()
 
     ###########################
     # Inside of OLMAR (algo 2)
@@ -98,7 +93,7 @@ def rebalance_portfolio(algo, data, desired_port):
 
     for i, sid in enumerate(algo.sids):
         current_amount[i] = algo.portfolio.positions[sid].amount
-        prices[i] = data.current(sid, "price")
+    prices[:] = data.current(algo.sids, "price")[algo.sids]
 
     desired_amount = np.round(desired_port * positions_value / prices)
 
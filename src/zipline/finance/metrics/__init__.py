@@ -27,6 +27,7 @@ from .metric import (
     BenchmarkReturnsAndVolatility,
     CashFlow,
     DailyLedgerField,
+    MaxDrawdown,
     MaxLeverage,
     NumTradingDays,
     Orders,
@@ -84,7 +85,7 @@ def default_metrics():
         AlphaBeta(),
         ReturnsStatistic(empyrical.sharpe_ratio, "sharpe"),
         ReturnsStatistic(empyrical.sortino_ratio, "sortino"),
-        ReturnsStatistic(empyrical.max_drawdown),
+        MaxDrawdown(),
         MaxLeverage(),
         # Please kill these!
         _ConstantCumulativeRiskMetric("excess_return", 0.0),
@@ -312,6 +312,61 @@ class ReturnsStatistic:
     end_of_session = end_of_bar
 
 
+class MaxDrawdown:
+    """Tracks the maximum drawdown of the algorithm returns.
+
+    This reports the same value as
+    ``ReturnsStatistic(empyrical.max_drawdown)`` but carries the cumulative
+    returns and their running peak across sessions instead of recomputing the
+    full drawdown series on every bar.
+    """
+
+    def start_of_simulation(self, *args):
+        self._next_session_ix = 0
+        self._cumulative_returns = 1.0
+        self._peak = self._starting_value = 100.0
+        self._max_drawdown = 0.0
+
+    def _update(self, daily_return):
+        """Fold one day of returns into the running state, returning the
+        new ``(cumulative_returns, peak, max_drawdown)`` without storing it.
+        """
+        cumulative_returns = self._cumulative_returns
+        if not np.isnan(daily_return):
+            cumulative_returns *= 1 + daily_return
+        value = cumulative_returns * self._starting_value
+
+        # NaN comparisons are False, matching the fmax/nanmin semantics of
+        # empyrical.
+        peak = self._peak
+        if value > peak:
+            peak = value
+        max_drawdown = self._max_drawdown
+        drawdown = (value - peak) / peak
+        if drawdown < max_drawdown:
+            max_drawdown = drawdown
+        return cumulative_returns, peak, max_drawdown
+
+    def end_of_bar(self, packet, ledger, dt, session_ix, data_portal):
+        daily_returns = ledger.daily_returns_array
+
+        # Returns of completed sessions are final, so fold them in once.
+        while self._next_session_ix < session_ix:
+            (
+                self._cumulative_returns,
+                self._peak,
+                self._max_drawdown,
+            ) = self._update(daily_returns[self._next_session_ix])
+            self._next_session_ix += 1
+
+        _, _, max_drawdown = self._update(daily_returns[session_ix])
+        if not np.isfinite(max_drawdown):
+            max_drawdown = None
+        packet["cumulative_risk_metrics"]["max_drawdown"] = max_drawdown
+
+    end_of_session = end_of_bar
+
+
 class AlphaBeta:
     """End of simulation alpha and beta to the benchmark."""
 
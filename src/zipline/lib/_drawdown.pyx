@@ -0,0 +1,55 @@
+"""
+Kernels for drawdown computations.
+"""
+cimport cython
+from cython.parallel cimport prange
+from libc.math cimport INFINITY, isnan
+from numpy cimport float64_t
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+@cython.embedsignature(True)
+cpdef void max_drawdown_2d(const float64_t[:, :] data, float64_t[:] out):
+    """
+    Compute the max drawdown of each column of ``data`` into ``out``.
+
+    Equivalent to:
+
+    drawdowns = fmax.accumulate(data, axis=0) - data
+    drawdowns[isnan(drawdowns)] = NINF
+    drawdown_ends = nanargmax(drawdowns, axis=0)
+    for i, end in enumerate(drawdown_ends):
+        peak = nanmax(data[:end + 1, i])
+        out[i] = (peak - data[end, i]) / data[end, i]
+    """
+    cdef:
+        Py_ssize_t nrows = data.shape[0]
+        Py_ssize_t ncols = data.shape[1]
+        Py_ssize_t i, j, end
+        float64_t value, running_max, peak, drawdown, max_drawdown
+
+    if nrows == 0:
+        return
+
+    # Columns are independent, so they are split across threads when the
+    # extension is built with OpenMP; otherwise this is a serial loop.
+    for j in prange(ncols, nogil=True, schedule="static"):
+        running_max = data[0, j]
+        peak = running_max
+        end = 0
+        max_drawdown = 0.0 if not isnan(running_max) else -INFINITY
+        for i in range(1, nrows):
+            value = data[i, j]
+            # Matches the semantics of numpy.fmax: NaNs are skipped.
+            if isnan(running_max) or value > running_max:
+                running_max = value
+            drawdown = running_max - value
+            # Strict comparison keeps the first occurrence of the max,
+            # like nanargmax.
+            if not isnan(drawdown) and drawdown > max_drawdown:
+                max_drawdown = drawdown
+                end = i
+                peak = running_max
+        out[j] = (peak - data[end, j]) / data[end, j]
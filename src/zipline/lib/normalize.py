@@ -41,7 +41,14 @@ def naive_grouped_rowwise_apply(data, group_labels, func, func_args=(), out=None
         out = np.empty_like(data)
 
     for (row, label_row, out_row) in zip(data, group_labels, out):
-        for label in np.unique(label_row):
-            locs = label_row == label
+        if not len(label_row):
+            continue
+        # A stable sort makes each group a contiguous run of positions, still
+        # in column order, so the groups can be sliced out of one sort instead
+        # of scanning the whole row once per unique label.
+        order = np.argsort(label_row, kind="stable")
+        sorted_labels = label_row[order]
+        group_starts = np.flatnonzero(sorted_labels[1:] != sorted_labels[:-1]) + 1
+        for locs in np.split(order, group_starts):
             out_row[locs] = func(row[locs], *func_args)
     return out
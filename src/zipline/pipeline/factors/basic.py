@@ -1,28 +1,24 @@
 """Simple common factors.
 """
+from functools import lru_cache
 from numbers import Number
 from numpy import (
     arange,
-    average,
     clip,
     copyto,
     exp,
-    fmax,
     full,
-    isnan,
     log,
-    NINF,
     sqrt,
     sum as np_sum,
     unique,
     errstate as np_errstate,
 )
 
+from zipline.lib._drawdown import max_drawdown_2d
 from zipline.pipeline.data import EquityPricing
 from zipline.utils.input_validation import expect_types
 from zipline.utils.math_utils import (
-    nanargmax,
-    nanmax,
     nanmean,
     nanstd,
     nansum,
@@ -156,14 +152,7 @@ class MaxDrawdown(SingleInputMixin, CustomFactor):
     ctx = ignore_nanwarnings()
 
     def compute(self, today, assets, out, data):
-        drawdowns = fmax.accumulate(data, axis=0) - data
-        drawdowns[isnan(drawdowns)] = NINF
-        drawdown_ends = nanargmax(drawdowns, axis=0)
-
-        # TODO: Accelerate this loop in Cython or Numba.
-        for i, end in enumerate(drawdown_ends):
-            peak = nanmax(data[: end + 1, i])
-            out[i] = (peak - data[end, i]) / data[end, i]
+        max_drawdown_2d(data, out)
 
 
 class AverageDollarVolume(CustomFactor):
@@ -203,6 +192,21 @@ def exponential_weights(length, decay_rate):
     return full(length, decay_rate, float64_dtype) ** arange(length + 1, 1, -1)
 
 
+@lru_cache(maxsize=64)
+def _normalized_exponential_weights(length, decay_rate):
+    """
+    Read-only, memoized :func:`exponential_weights`, scaled to sum to 1.
+
+    Exponentially-weighted factors are computed once per session with the same
+    window length and decay rate, so the weight vector and its normalization
+    only need to be computed once per backtest.
+    """
+    weights = exponential_weights(length, decay_rate)
+    weights /= np_sum(weights)
+    weights.setflags(write=False)
+    return weights
+
+
 class _ExponentialWeightedFactor(SingleInputMixin, CustomFactor):
     """
     Base class for factors implementing exponential-weighted operations.
@@ -390,11 +394,11 @@ class ExponentialWeightedMovingAverage(_ExponentialWeightedFactor):
     """
 
     def compute(self, today, assets, out, data, decay_rate):
-        out[:] = average(
-            data,
-            axis=0,
-            weights=exponential_weights(len(data), decay_rate),
-        )
+        weights = _normalized_exponential_weights(len(data), decay_rate)
+        # A single matrix-vector product is equivalent to
+        # ``average(data, axis=0, weights=weights)`` but avoids materializing
+        # the weighted copy of ``data``.
+        out[:] = weights.dot(data)
 
 
 class ExponentialWeightedMovingStdDev(_ExponentialWeightedFactor):
@@ -429,15 +433,14 @@ class ExponentialWeightedMovingStdDev(_ExponentialWeightedFactor):
     """
 
     def compute(self, today, assets, out, data, decay_rate):
-        weights = exponential_weights(len(data), decay_rate)
+        weights = _normalized_exponential_weights(len(data), decay_rate)
 
-        mean = average(data, axis=0, weights=weights)
-        variance = average((data - mean) ** 2, axis=0, weights=weights)
+        mean = weights.dot(data)
+        variance = weights.dot((data - mean) ** 2)
 
-        squared_weight_sum = np_sum(weights) ** 2
-        bias_correction = squared_weight_sum / (
-            squared_weight_sum - np_sum(weights**2)
-        )
+        # The weights sum to 1, so the usual correction of
+        # sum(w) ** 2 / (sum(w) ** 2 - sum(w ** 2)) reduces to this.
+        bias_correction = 1.0 / (1.0 - weights.dot(weights))
         out[:] = sqrt(variance * bias_correction)
 
 
@@ -1876,20 +1876,26 @@ def winsorize(row, min_percentile, max_percentile):
     a = row.copy()
     nan_count = isnan(row).sum()
     nonnan_count = a.size - nan_count
-
-    # NOTE: argsort() sorts nans to the end of the array.
-    idx = a.argsort()
+    lower_cutoff = int(min_percentile * nonnan_count)
+    upper_cutoff = int(ceil(nonnan_count * max_percentile))
+
+    # Only the entries at the cutoffs need to be in sorted position, so
+    # partition around them instead of sorting the whole row. Partitioning at
+    # the last non-nan entry keeps the nans at the end of the array.
+    # NOTE: argpartition() treats nans as larger than any other value.
+    kth = [
+        k for k in (lower_cutoff, upper_cutoff - 1, nonnan_count - 1) if 0 <= k < a.size
+    ]
+    idx = a.argpartition(kth) if kth else a.argsort()
 
     # Set values at indices below the min percentile to the value of the entry
     # at the cutoff.
     if min_percentile > 0:
-        lower_cutoff = int(min_percentile * nonnan_count)
         a[idx[:lower_cutoff]] = a[idx[lower_cutoff]]
 
     # Set values at indices above the max percentile to the value of the entry
     # at the cutoff.
     if max_percentile < 1:
-        upper_cutoff = int(ceil(nonnan_count * max_percentile))
         # if max_percentile is close to 1, then upper_cutoff might not
         # remove any values.
         if upper_cutoff < nonnan_count:
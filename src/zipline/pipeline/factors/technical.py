@@ -2,9 +2,9 @@
 Technical Analysis Factors
 --------------------------
 """
+
 from numpy import (
     abs,
-    average,
     clip,
     diff,
     dstack,
@@ -26,7 +26,7 @@ from zipline.utils.math_utils import (
 )
 from zipline.utils.numpy_utils import rolling_window
 
-from .basic import exponential_weights
+from .basic import _normalized_exponential_weights
 from .basic import (  # noqa reexport
     # These are re-exported here for backwards compatibility with the old
     # definition site.
@@ -369,19 +369,22 @@ class MovingAverageConvergenceDivergenceSignal(CustomFactor):
             **kwargs,
         )
 
-    def _ewma(self, data, length):
+    @staticmethod
+    def _ewma_weights(length):
         decay_rate = 1.0 - (2.0 / (1.0 + length))
-        return average(data, axis=1, weights=exponential_weights(length, decay_rate))
+        return _normalized_exponential_weights(length, decay_rate)
 
     def compute(
         self, today, assets, out, close, fast_period, slow_period, signal_period
     ):
-        slow_EWMA = self._ewma(rolling_window(close, slow_period), slow_period)
-        fast_EWMA = self._ewma(
-            rolling_window(close, fast_period)[-signal_period:], fast_period
-        )
-        macd = fast_EWMA - slow_EWMA
-        out[:] = self._ewma(macd.T, signal_period)
+        # Each fast window is the trailing ``fast_period`` rows of the slow
+        # window ending on the same day, so fast EWMA - slow EWMA is a single
+        # weighted sum over the slow window. Folding both weight vectors into
+        # one lets us sweep ``close`` once instead of once per average.
+        macd_weights = -self._ewma_weights(slow_period)
+        macd_weights[-fast_period:] += self._ewma_weights(fast_period)
+        macd = macd_weights @ rolling_window(close, slow_period)
+        out[:] = self._ewma_weights(signal_period) @ macd
 
 
 # Convenience aliases.
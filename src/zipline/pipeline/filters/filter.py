@@ -7,6 +7,7 @@ from operator import attrgetter
 from numpy import (
     any as np_any,
     float64,
+    fromiter,
     nan,
     nanpercentile,
     uint8,
@@ -41,6 +42,7 @@ from zipline.pipeline.mixins import (
 )
 from zipline.pipeline.term import ComputableTerm, Term
 from zipline.utils.input_validation import expect_types
+from zipline.utils.memoize import lazyval
 from zipline.utils.numpy_utils import (
     same,
     bool_dtype,
@@ -669,8 +671,15 @@ class StaticSids(Filter):
         sids = frozenset(sids)
         return super(StaticSids, cls).__new__(cls, sids=sids)
 
+    @lazyval
+    def _sids_array(self):
+        # The sids are fixed for the lifetime of the term, so convert them to
+        # an array once rather than re-hashing the frozenset on every compute.
+        sids = self.params["sids"]
+        return fromiter(sids, dtype=int64_dtype, count=len(sids))
+
     def _compute(self, arrays, dates, sids, mask):
-        my_columns = sids.isin(self.params["sids"])
+        my_columns = sids.isin(self._sids_array)
         return repeat_first_axis(my_columns, len(mask)) & mask
 
 
@@ -1,6 +1,8 @@
 """Pipeline hooks for tracking and displaying progress.
 """
 from collections import namedtuple
+from functools import lru_cache
+from importlib.util import find_spec
 import time
 
 from interface import implements
@@ -259,10 +261,16 @@ class ProgressModel:
         self._progress += nterms * self._completed_term_increment
 
 
-try:
-    import ipywidgets
+# ipywidgets and IPython are only needed when a notebook progress bar is
+# actually requested, so we only check that they are installed here and defer
+# the (slow) imports until an IPythonWidgetProgressPublisher is created.
+HAVE_WIDGETS = find_spec("ipywidgets") is not None
+HAVE_IPYTHON = find_spec("IPython") is not None
+
 
-    HAVE_WIDGETS = True
+@lru_cache(maxsize=None)
+def _progress_bar_container_type():
+    import ipywidgets
 
     # This VBox subclass exists to work around a strange display issue but
     # where the repr of the progress bar sometimes gets re-displayed upon
@@ -273,15 +281,7 @@ try:
         def __repr__(self):
             return ""
 
-except ImportError:
-    HAVE_WIDGETS = False
-
-try:
-    from IPython.display import display, HTML as IPython_HTML
-
-    HAVE_IPYTHON = True
-except ImportError:
-    HAVE_IPYTHON = False
+    return ProgressBarContainer
 
 
 # XXX: This class is currently untested, because we don't require ipywidgets as
@@ -302,6 +302,8 @@ class IPythonWidgetProgressPublisher:
                 "\nMissing:\n{}".format(bulleted_list(missing))
             )
 
+        import ipywidgets
+
         # Heading for progress display.
         self._heading = ipywidgets.HTML()
 
@@ -337,7 +339,7 @@ class IPythonWidgetProgressPublisher:
         self._details_tab.set_title(0, "Details")
 
         # Container for the combined widget.
-        self._layout = ProgressBarContainer(
+        self._layout = _progress_bar_container_type()(
             [
                 self._heading,
                 bar_and_percent,
@@ -378,6 +380,8 @@ class IPythonWidgetProgressPublisher:
         elif model.state == "success":
             # Replace widget layout with html that can be persisted.
             self._stop_displaying()
+            from IPython.display import display, HTML as IPython_HTML
+
             display(
                 IPython_HTML(
                     "<b>Pipeline Execution Time:</b> {}".format(
@@ -395,6 +399,8 @@ class IPythonWidgetProgressPublisher:
 
     def _ensure_displayed(self):
         if not self._displayed:
+            from IPython.display import display
+
             display(self._layout)
             self._displayed = True
 
@@ -23,6 +23,7 @@ from zipline.pipeline.common import (
 )
 from zipline.pipeline.loaders.base import PipelineLoader
 from zipline.utils.date_utils import make_utc_aware
+from zipline.utils.memoize import lazyval
 from zipline.utils.numpy_utils import datetime64ns_dtype, float64_dtype
 from zipline.pipeline.loaders.utils import (
     ffill_across_cols,
@@ -894,6 +895,11 @@ class SplitAdjustedEstimatesLoader(EarningsEstimatesLoader):
         self._split_adjustment_dict = {}
         super(SplitAdjustedEstimatesLoader, self).__init__(estimates, name_map)
 
+    @lazyval
+    def _estimates_by_sid(self):
+        """The estimates of each sid, partitioned in a single groupby pass."""
+        return dict(iter(self.estimates.groupby(SID_FIELD_NAME, sort=False)))
+
     @abstractmethod
     def collect_split_adjustments(
         self,
@@ -949,7 +955,10 @@ class SplitAdjustedEstimatesLoader(EarningsEstimatesLoader):
         ) = self.retrieve_split_adjustment_data_for_sid(
             dates, sid, split_adjusted_asof_idx
         )
-        sid_estimates = self.estimates[self.estimates[SID_FIELD_NAME] == sid]
+        try:
+            sid_estimates = self._estimates_by_sid[sid]
+        except KeyError:
+            sid_estimates = self.estimates.iloc[:0]
         # We might not have any overwrites but still have
         # adjustments, and we will need to manually add columns if
         # that is the case.
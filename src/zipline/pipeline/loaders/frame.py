@@ -1,6 +1,7 @@
 """
 PipelineLoader accepting a DataFrame as input.
 """
+
 from functools import partial
 
 from interface import implements
@@ -122,13 +123,14 @@ class DataFrameLoader(implements(PipelineLoader)):
         # This logic relies on the sorting applied on the previous line.
         out = {}
         previous_apply_date = object()
-        for row in adjustments_to_use.itertuples():
+        # Get the next apply date if no exact match, for every adjustment in
+        # one lookup rather than one lookup per apply_date.
+        row_locs = dates.get_indexer(adjustments_to_use.index, method="bfill")
+        for row_loc, row in zip(row_locs, adjustments_to_use.itertuples()):
             # This expansion depends on the ordering of the DataFrame columns,
             # defined above.
             apply_date, sid, value, kind, start_date, end_date = row
             if apply_date != previous_apply_date:
-                # Get the next apply date if no exact match.
-                row_loc = dates.get_indexer([apply_date], method="bfill")[0]
                 current_date_adjustments = out[row_loc] = []
                 previous_apply_date = apply_date
 
@@ -148,9 +150,24 @@ class DataFrameLoader(implements(PipelineLoader)):
         column = columns[0]
         self._validate_input_column(column)
 
-        date_indexer = self.dates.get_indexer(dates)
-        assets_indexer = self.assets.get_indexer(sids)
+        return {
+            column: self._load_indexed(
+                column,
+                dates,
+                sids,
+                mask,
+                self.dates.get_indexer(dates),
+                self.assets.get_indexer(sids),
+            ),
+        }
+
+    def _load_indexed(self, column, dates, sids, mask, date_indexer, assets_indexer):
+        """Build the AdjustedArray for ``column`` given precomputed positions of
+        ``dates`` and ``sids`` in our baseline.
 
+        Loaders that hold several frames over the same labels use this to look
+        up the requested dates and sids once for all of their columns.
+        """
         # Boolean arrays with True on matched entries
         good_dates = date_indexer != -1
         good_assets = assets_indexer != -1
@@ -161,14 +178,12 @@ class DataFrameLoader(implements(PipelineLoader)):
         # Mask out requested columns/rows that didn't match.
         data[~mask] = column.missing_value
 
-        return {
-            column: AdjustedArray(
-                # Pull out requested columns/rows from our baseline data.
-                data=data,
-                adjustments=self.format_adjustments(dates, sids),
-                missing_value=column.missing_value,
-            ),
-        }
+        return AdjustedArray(
+            # Pull out requested columns/rows from our baseline data.
+            data=data,
+            adjustments=self.format_adjustments(dates, sids),
+            missing_value=column.missing_value,
+        )
 
     def _validate_input_column(self, column):
         """Make sure a passed column is our column."""
@@ -3,8 +3,8 @@
 from interface import implements
 import numpy as np
 
-from numpy.random import RandomState
-from pandas import DataFrame, Timestamp
+from numpy.random import default_rng
+from pandas import DataFrame, Index, Timestamp
 from sqlite3 import connect as sqlite3_connect
 
 from .base import PipelineLoader
@@ -53,6 +53,11 @@ class PrecomputedLoader(implements(PipelineLoader)):
     """
 
     def __init__(self, constants, dates, sids):
+        # All of the sub-loaders share the same labels, which lets us look up
+        # the requested dates and sids once per load rather than per column.
+        self._dates = dates = Index(dates)
+        self._sids = sids = Index(sids)
+
         loaders = {}
         for column, const in constants.items():
             frame = DataFrame(
@@ -71,6 +76,9 @@ class PrecomputedLoader(implements(PipelineLoader)):
 
     def load_adjusted_array(self, domain, columns, dates, sids, mask):
         """Load by delegating to sub-loaders."""
+        date_indexer = self._dates.get_indexer(dates)
+        assets_indexer = self._sids.get_indexer(sids)
+
         out = {}
         for col in columns:
             try:
@@ -79,7 +87,14 @@ class PrecomputedLoader(implements(PipelineLoader)):
                     loader = self._loaders[col.unspecialize()]
             except KeyError as exc:
                 raise ValueError("Couldn't find loader for %s" % col) from exc
-            out.update(loader.load_adjusted_array(domain, [col], dates, sids, mask))
+            out[col] = loader._load_indexed(
+                col,
+                dates,
+                sids,
+                mask,
+                date_indexer,
+                assets_indexer,
+            )
         return out
 
 
@@ -112,7 +127,7 @@ class SeededRandomLoader(PrecomputedLoader):
     Parameters
     ----------
     seed : int
-        Seed for numpy.random.RandomState.
+        Seed for a numpy.random.Generator.
     columns : list[BoundColumn]
         Columns that this loader should know about.
     dates : iterable[datetime-like]
@@ -142,12 +157,12 @@ class SeededRandomLoader(PrecomputedLoader):
 
     @property
     def state(self):
-        """Make a new RandomState from our seed.
+        """Make a new PCG64-backed Generator from our seed.
 
         This ensures that every call to _*_values produces the same output
         every time for a given SeededRandomLoader instance.
         """
-        return RandomState(self._seed)
+        return default_rng(self._seed)
 
     def _float_values(self, shape):
         """Return uniformly-distributed floats between -0.0 and 100.0."""
@@ -157,14 +172,12 @@ class SeededRandomLoader(PrecomputedLoader):
         """
         Return uniformly-distributed integers between 0 and 100.
         """
-        return self.state.randint(low=0, high=100, size=shape).astype(
-            "int64"
-        )  # default is system int
+        return self.state.integers(low=0, high=100, size=shape, dtype="int64")
 
     def _datetime_values(self, shape):
         """Return uniformly-distributed dates in 2014."""
         start = Timestamp("2014", tz="UTC").asm8
-        offsets = self.state.randint(
+        offsets = self.state.integers(
             low=0,
             high=364,
             size=shape,
@@ -173,7 +186,9 @@ class SeededRandomLoader(PrecomputedLoader):
 
     def _bool_values(self, shape):
         """Return uniformly-distributed True/False values."""
-        return self.state.randn(*shape) < 0
+        # Drawing booleans directly consumes a single random bit per value,
+        # rather than sampling a normal and thresholding it.
+        return self.state.integers(0, 2, size=shape, dtype=bool)
 
     def _object_values(self, shape):
         res = self._int_values(shape).astype(str).astype(object)
@@ -345,34 +360,28 @@ def expected_bar_values_2d(dates, assets, asset_info, colname, holes=None):
         missing = float("nan")
 
     data = np.full((len(dates), len(assets)), missing, dtype=dtype)
+
+    # The date and column components of the expected value are shared by
+    # every asset, so compute them once for the whole block of dates.
+    # TODO FIXME TZ MESS
+    tz = dates.tz
+    from_date = (dates - PSEUDO_EPOCH_NAIVE.tz_localize(tz)).days.values
+    from_colname = OHLCV.index(colname) * 1000
+
     for j, asset in enumerate(assets):
         # Use missing values when asset_id is not contained in asset_info.
         if asset not in asset_info.index:
             continue
 
-        start = asset_start(asset_info, asset)
-        end = asset_end(asset_info, asset)
-        for i, date in enumerate(dates):
-            # No value expected for dates outside the asset's start/end
-            # date.
-            # TODO FIXME TZ MESS
-            if not (
-                start.tz_localize(date.tzinfo) <= date <= end.tz_localize(date.tzinfo)
-            ):
-                continue
-
-            if holes is not None:
-                expected = expected_bar_value_with_holes(
-                    asset,
-                    date,
-                    colname,
-                    holes,
-                    missing,
-                )
-            else:
-                expected = expected_bar_value(asset, date, colname)
-
-            data[i, j] = expected
+        # No value expected for dates outside the asset's start/end date.
+        alive = (dates >= asset_start(asset_info, asset, tz)) & (
+            dates <= asset_end(asset_info, asset, tz)
+        )
+        if holes is not None and asset in holes:
+            # Explicit holes are filled with the missing value.
+            alive &= ~dates.isin(holes[asset])
+
+        data[alive, j] = asset * 100000 + from_colname + from_date[alive]
     return data
 
 
@@ -133,8 +133,9 @@ def _render(g, out, format_, include_asset_exists=False):
         else:
             raise
 
-    f.seek(0)
-    proc_stdout, proc_stderr = proc.communicate(f.read())
+    # Hand dot a view of the buffer rather than reading a copy of it back out.
+    with f.getbuffer() as dot_source:
+        proc_stdout, proc_stderr = proc.communicate(dot_source)
     if proc_stderr:
         raise RuntimeError(
             "Error(s) while rendering graph: %s" % proc_stderr.decode("utf-8")
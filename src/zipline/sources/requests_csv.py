@@ -17,6 +17,11 @@ from zipline.assets import Equity
 
 logger = logging.getLogger("Requests Source Logger")
 
+# An algorithm may call fetch_csv several times, often against the same host;
+# sharing one session lets those fetches reuse the pooled connection instead
+# of each paying for a new TCP and TLS handshake.
+_SESSION = requests.Session()
+
 
 def roll_dts_to_midnight(dts, trading_day):
     if len(dts) == 0:
@@ -336,14 +341,19 @@ class PandasCSV(ABC):
             # Fill any zero entries left in our sid column by doing a lookup
             # using both symbol and the row date.
             conflict_rows = df[df["sid"] == 0]
-            for row_idx, row in conflict_rows.iterrows():
+            sid_loc = df.columns.get_loc("sid")
+            for row_idx, symbol, dt in zip(
+                conflict_rows.index,
+                conflict_rows[self.symbol_column],
+                conflict_rows["dt"],
+            ):
                 try:
                     asset = (
                         self.finder.lookup_symbol(
-                            row[self.symbol_column],
+                            symbol,
                             # Replacing tzinfo here is necessary because of the
                             # timezone metadata bug described below.
-                            row["dt"].replace(tzinfo=datetime.tzinfo.utc),
+                            dt.replace(tzinfo=datetime.tzinfo.utc),
                             country_code=self.country_code,
                             # It's possible that no asset comes back here if our
                             # lookup date is from before any asset held the
@@ -356,7 +366,7 @@ class PandasCSV(ABC):
                     asset = numpy.nan
 
                 # Assign the resolved asset to the cell
-                df.iloc[row_idx, df.columns.get_loc("sid")] = asset
+                df.iloc[row_idx, sid_loc] = asset
 
             # Filter out rows containing symbols that we failed to find.
             length_before_drop = len(df)
@@ -398,7 +408,10 @@ class PandasCSV(ABC):
 
     def __iter__(self):
         asset_cache = {}
-        for dt, series in self.df.iterrows():
+        columns = self.df.columns
+        # itertuples yields plain tuples of each column's own scalar type,
+        # instead of boxing every row into a Series like iterrows does.
+        for dt, *values in self.df.itertuples(name=None):
             if dt < self.start_date:
                 continue
 
@@ -410,7 +423,7 @@ class PandasCSV(ABC):
             # the dt column is dropped. So, we need to manually copy
             # dt into the event.
             event.dt = dt
-            for k, v in series.iteritems():
+            for k, v in zip(columns, values):
                 # convert numpy integer types to
                 # int. This assumes we are on a 64bit
                 # platform that will not lose information
@@ -456,7 +469,7 @@ class PandasRequestsCSV(PandasCSV):
     MAX_DOCUMENT_SIZE = (1024 * 1024) * 100
 
     # maximum number of bytes to read in at a time
-    CONTENT_CHUNK_SIZE = 4096
+    CONTENT_CHUNK_SIZE = 64 * 1024
 
     def __init__(
         self,
@@ -528,7 +541,7 @@ class PandasRequestsCSV(PandasCSV):
         # UnicodeEncodeError exception, so instead we'll use
         # pandas logic for decoding content
         try:
-            response = requests.get(url, **self.requests_kwargs)
+            response = _SESSION.get(url, **self.requests_kwargs)
         except requests.exceptions.ConnectionError as exc:
             raise Exception("Could not connect to %s" % url) from exc
 
@@ -568,23 +581,18 @@ class PandasRequestsCSV(PandasCSV):
         # create a data frame directly from the full text of
         # the response from the returned file-descriptor.
         data = self.fetch_url(self.url)
-        fd = StringIO()
-
-        if isinstance(data, str):
-            fd.write(data)
-        else:
-            for chunk in data:
-                fd.write(chunk)
-
-        self.fetch_size = fd.tell()
+        # join the chunks once, then parse and hash that same text instead
+        # of copying the buffer back out of the file-descriptor.
+        text = data if isinstance(data, str) else "".join(data)
+        self.fetch_size = len(text)
 
-        fd.seek(0)
+        fd = StringIO(text)
 
         try:
             # see if pandas can parse csv data
             frames = pd.read_csv(fd, **self.pandas_kwargs)
 
-            frames_hash = hashlib.md5(str(fd.getvalue()).encode("utf-8"))
+            frames_hash = hashlib.md5(text.encode("utf-8"))
             self.fetch_hash = frames_hash.hexdigest()
         except pd.parser.CParserError as exc:
             # could not parse the data, raise exception
@@ -260,15 +260,16 @@ def make_trade_data_for_asset_info(
     volume_date_deltas = np.arange(len(dates)) * volume_step_by_date
     volumes = volume_sid_deltas + as_column(volume_date_deltas) + volume_start
 
+    # Normalize here so the we still generate non-NaN values on the minutes
+    # for an asset's last trading day.
+    # TODO FIXME TZ MESS
+    normalized_dates = dates.normalize().tz_localize(None)
+
     for j, sid in enumerate(sids):
         start_date, end_date = asset_info.loc[sid, ["start_date", "end_date"]]
-        # Normalize here so the we still generate non-NaN values on the minutes
-        # for an asset's last trading day.
-        # TODO FIXME TZ MESS
-        for i, date in enumerate(dates.normalize().tz_localize(None)):
-            if not (start_date <= date <= end_date):
-                prices[i, j] = 0
-                volumes[i, j] = 0
+        dead = (normalized_dates < start_date) | (normalized_dates > end_date)
+        prices[dead, j] = 0
+        volumes[dead, j] = 0
 
         df = pd.DataFrame(
             {
@@ -779,11 +779,10 @@ class WithEquityDailyBarData(WithAssetFinder, WithTradingCalendars):
         assert issubclass(
             cls, WithEquityMinuteBarData
         ), "Can't source daily data from minute without minute data!"
-        assets = cls.asset_finder.retrieve_all(cls.asset_finder.equities_sids)
         minute_data = dict(cls.make_equity_minute_bar_data())
-        for asset in assets:
-            yield asset.sid, minute_frame_to_session_frame(
-                minute_data[asset.sid], cls.trading_calendars[Equity]
+        for sid in cls.asset_finder.equities_sids:
+            yield sid, minute_frame_to_session_frame(
+                minute_data[sid], cls.trading_calendars[Equity]
             )
 
     @classmethod
@@ -920,11 +919,10 @@ class WithFutureDailyBarData(WithAssetFinder, WithTradingCalendars):
         assert issubclass(
             cls, WithFutureMinuteBarData
         ), "Can't source daily data from minute without minute data!"
-        assets = cls.asset_finder.retrieve_all(cls.asset_finder.futures_sids)
         minute_data = dict(cls.make_future_minute_bar_data())
-        for asset in assets:
-            yield asset.sid, minute_frame_to_session_frame(
-                minute_data[asset.sid], cls.trading_calendars[Future]
+        for sid in cls.asset_finder.futures_sids:
+            yield sid, minute_frame_to_session_frame(
+                minute_data[sid], cls.trading_calendars[Future]
             )
 
     @classmethod
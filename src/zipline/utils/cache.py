@@ -1,4 +1,5 @@
 """Caching utilities for zipline"""
+
 from collections.abc import MutableMapping
 import errno
 from functools import partial
@@ -185,10 +186,13 @@ class dataframe_cache(MutableMapping):
     clean_on_failure : bool, optional
         Should the directory be cleaned up if an exception is raised in the
         context manager.
-    serialize : {'msgpack', 'pickle:<n>'}, optional
+    serialize : {'msgpack', 'parquet', 'feather', 'pickle:<n>'}, optional
         How should the data be serialized. If ``'pickle'`` is passed, an
         optional pickle protocol can be passed like: ``'pickle:3'`` which says
-        to use pickle protocol 3.
+        to use pickle protocol 3. ``'parquet'`` stores each frame in a
+        compressed columnar file and ``'feather'`` in an uncompressed Arrow
+        IPC file, which is the fastest to read back. Both require ``pyarrow``
+        and only support DataFrames with string column labels.
 
     Notes
     -----
@@ -209,11 +213,20 @@ class dataframe_cache(MutableMapping):
             self.serialize = pd.DataFrame.to_msgpack
             self.deserialize = pd.read_msgpack
             self._protocol = None
+        elif serialization == "parquet":
+            self.serialize = self._serialize_parquet
+            self.deserialize = pd.read_parquet
+            self._protocol = None
+        elif serialization == "feather":
+            self.serialize = self._serialize_feather
+            self.deserialize = pd.read_feather
+            self._protocol = None
         else:
             s = serialization.split(":", 1)
             if s[0] != "pickle":
                 raise ValueError(
-                    "'serialization' must be either 'msgpack' or 'pickle[:n]'",
+                    "'serialization' must be one of 'msgpack', 'parquet',"
+                    " 'feather' or 'pickle[:n]'",
                 )
             self._protocol = int(s[1]) if len(s) == 2 else None
 
@@ -226,6 +239,18 @@ class dataframe_cache(MutableMapping):
         with open(path, "wb") as f:
             pickle.dump(df, f, protocol=self._protocol)
 
+    @staticmethod
+    def _serialize_parquet(df, path):
+        df.to_parquet(path)
+
+    @staticmethod
+    def _serialize_feather(df, path):
+        # DataFrame.to_feather only accepts a default index; pyarrow stores
+        # any index alongside the columns and read_feather restores it.
+        from pyarrow import feather
+
+        feather.write_feather(df, path, compression="uncompressed")
+
     def _keypath(self, key):
         return os.path.join(self.path, key)
 
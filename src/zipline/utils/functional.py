@@ -1,6 +1,9 @@
 from functools import reduce
 from operator import itemgetter
 from pprint import pformat
+from queue import Full, Queue
+from threading import Event, Thread
+
 from toolz import curry, flip
 
 from .sentinel import sentinel
@@ -419,3 +422,61 @@ def keysorted(d):
     [('a', 3), ('b', 2), ('c', 1)]
     """
     return sorted(d.items(), key=itemgetter(0))
+
+
+def prefetch(iterable, maxsize=1):
+    """Iterate over ``iterable`` on a background thread, keeping up to
+    ``maxsize`` items ready for the consumer.
+
+    This lets the work that produces each item overlap with the work that
+    consumes it, as long as either side releases the GIL.
+
+    Parameters
+    ----------
+    iterable : iterable
+        The iterable to consume in the background.
+    maxsize : int, optional
+        The most items to produce ahead of the consumer.
+
+    Yields
+    ------
+    item : any
+        The items of ``iterable``, in order. An exception raised while
+        producing an item is re-raised in the consumer.
+    """
+    items = Queue(maxsize=maxsize)
+    stopped = Event()
+
+    def put(message):
+        # Give up once the consumer has gone away instead of blocking forever
+        # on a full queue.
+        while not stopped.is_set():
+            try:
+                items.put(message, timeout=0.1)
+            except Full:
+                continue
+            return True
+        return False
+
+    def produce():
+        try:
+            for item in iterable:
+                if not put((True, item)):
+                    return
+        except BaseException as exc:
+            put((False, exc))
+        else:
+            put((False, None))
+
+    Thread(target=produce, daemon=True).start()
+    try:
+        while True:
+            ok, item = items.get()
+            if ok:
+                yield item
+            elif item is None:
+                return
+            else:
+                raise item
+    finally:
+        stopped.set()
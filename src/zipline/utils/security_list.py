@@ -58,8 +58,11 @@ class SecurityList:
         return item in self.current_securities(self.current_date())
 
     def current_securities(self, dt):
+        # The knowledge dates are naive, so compare them against the wall time
+        # of ``dt`` once instead of localizing every knowledge date to its tz.
+        wall_dt = dt.replace(tzinfo=None)
         for kd in self._knowledge_dates:
-            if dt < kd.tz_localize(dt.tzinfo):
+            if wall_dt < kd:
                 break
             if kd in self._cache:
                 self._current_set = self._cache[kd]
@@ -1,15 +1,24 @@
 import numpy as np
 import pandas as pd
+import pytest
+import requests
 import toolz.curried.operator as op
+from unittest import mock
 from os.path import (
     dirname,
+    exists,
     join,
     realpath,
 )
 
 from zipline.utils.calendar_utils import get_calendar
 from zipline.data.bundles import ingest, load, bundles
-from zipline.data.bundles.quandl import format_metadata_url, load_data_table
+from zipline.data.bundles.core import cache_path
+from zipline.data.bundles.quandl import (
+    fetch_data_table,
+    format_metadata_url,
+    load_data_table,
+)
 from zipline.lib.adjustment import Float64Multiply
 from zipline.testing import (
     tmp_dir,
@@ -20,6 +29,7 @@ from zipline.testing.fixtures import (
     WithResponses,
 )
 
+from zipline.utils.cache import dataframe_cache
 from zipline.utils.functional import apply
 from zipline.testing.github_actions import skip_on
 
@@ -243,3 +253,107 @@ class QuandlBundleTestCase(WithResponses, ZiplineTestCase):
             self.columns, adjs_for_cols, expected_adjustments
         ):
             assert adjustments == expected, column
+
+    @skip_on(PermissionError)
+    def test_bundle_reuses_recent_download(self):
+        with open(
+            join(TEST_RESOURCE_PATH, "quandl_samples", "QUANDL_ARCHIVE.zip"),
+            "rb",
+        ) as quandl_response:
+            self.responses.add(
+                self.responses.GET,
+                "https://file_url.mock.quandl",
+                body=quandl_response.read(),
+                content_type="application/zip",
+                status=200,
+            )
+
+        url_map = {
+            format_metadata_url(self.api_key): join(
+                TEST_RESOURCE_PATH,
+                "quandl_samples",
+                "metadata.csv.gz",
+            )
+        }
+
+        zipline_root = self.enter_instance_context(tmp_dir()).path
+        environ = {
+            "ZIPLINE_ROOT": zipline_root,
+            "QUANDL_API_KEY": self.api_key,
+        }
+
+        cached_table = join(zipline_root, "cache", "quandl", "raw_data")
+
+        with patch_read_csv(url_map):
+            # by default no copy of the table is kept
+            ingest("quandl", environ=environ)
+            assert len(self.responses.calls) == 1
+            assert not exists(cached_table)
+
+            caching_environ = {**environ, "QUANDL_CACHE_MAX_AGE": "1 day"}
+            ingest("quandl", environ=caching_environ)
+            ingest("quandl", environ=caching_environ)
+            assert len(self.responses.calls) == 2
+            assert exists(cached_table)
+
+            # an expired table is downloaded again and its copy removed
+            ingest("quandl", environ={**environ, "QUANDL_CACHE_MAX_AGE": "0"})
+            assert len(self.responses.calls) == 3
+            assert not exists(cached_table)
+
+    def test_fetch_does_not_retry_client_errors(self):
+        self.responses.add(
+            self.responses.GET,
+            "https://file_url.mock.quandl",
+            status=404,
+        )
+        url_map = {
+            format_metadata_url(self.api_key): join(
+                TEST_RESOURCE_PATH,
+                "quandl_samples",
+                "metadata.csv.gz",
+            )
+        }
+
+        with patch_read_csv(url_map), pytest.raises(requests.HTTPError):
+            fetch_data_table(self.api_key, show_progress=False, retries=5)
+
+        assert len(self.responses.calls) == 1
+
+    def test_fetch_retries_download_with_same_link(self):
+        self.responses.add(
+            self.responses.GET,
+            "https://file_url.mock.quandl",
+            status=500,
+        )
+        with open(
+            join(TEST_RESOURCE_PATH, "quandl_samples", "QUANDL_ARCHIVE.zip"),
+            "rb",
+        ) as quandl_response:
+            self.responses.add(
+                self.responses.GET,
+                "https://file_url.mock.quandl",
+                body=quandl_response.read(),
+                content_type="application/zip",
+                status=200,
+            )
+
+        metadata_url = format_metadata_url(self.api_key)
+        url_map = {
+            metadata_url: join(
+                TEST_RESOURCE_PATH,
+                "quandl_samples",
+                "metadata.csv.gz",
+            )
+        }
+
+        with patch_read_csv(url_map), mock.patch(
+            "pandas.read_csv", wraps=pd.read_csv
+        ) as read_csv, mock.patch("time.sleep"):
+            fetch_data_table(self.api_key, show_progress=False, retries=5)
+
+        assert len(self.responses.calls) == 2
+        metadata_reads = [
+            call for call in read_csv.call_args_list if call.args[0] == metadata_url
+        ]
+        assert len(metadata_reads) == 1
@@ -31,12 +31,13 @@ class TestSQLiteAdjustmentsWriter(
         super(TestSQLiteAdjustmentsWriter, self).init_instance_fixtures()
         self.db_path = self.instance_tmpdir.getpath("adjustments.db")
 
-    def writer(self, session_bar_reader):
+    def writer(self, session_bar_reader, **kwargs):
         return self.enter_instance_context(
             SQLiteAdjustmentWriter(
                 self.db_path,
                 session_bar_reader,
                 overwrite=True,
+                **kwargs,
             ),
         )
 
@@ -58,8 +59,8 @@ class TestSQLiteAdjustmentsWriter(
             currency_codes=pd.Series(index=sids, data="USD"),
         )
 
-    def writer_without_pricing(self, dates, sids):
-        return self.writer(self.empty_in_memory_reader(dates, sids))
+    def writer_without_pricing(self, dates, sids, **kwargs):
+        return self.writer(self.empty_in_memory_reader(dates, sids), **kwargs)
 
     def in_memory_reader_for_close(self, close):
         nan_frame = pd.DataFrame(
@@ -200,7 +201,7 @@ class TestSQLiteAdjustmentsWriter(
                 in self._caplog.messages
             )
 
-    def _test_identity(self, name):
+    def _test_identity(self, name, **writer_kwargs):
         sids = np.arange(5)
 
         # tx_convert makes tz-naive
@@ -221,7 +222,9 @@ class TestSQLiteAdjustmentsWriter(
             columns=["effective_date", "ratio", "sid"],
         ).sort_values(sort_key)
 
-        self.writer_without_pricing(dates, sids).write(**{name: input_})
+        self.writer_without_pricing(dates, sids, **writer_kwargs).write(
+            **{name: input_}
+        )
         dfs = self.component_dataframes()
 
         output = dfs.pop(name).sort_values(sort_key)
@@ -235,6 +238,10 @@ class TestSQLiteAdjustmentsWriter(
     def test_mergers(self):
         self._test_identity("mergers")
 
+    def test_splits_written_in_chunks(self):
+        # Use a chunk size that does not evenly divide the number of rows.
+        self._test_identity("splits", chunk_size=2)
+
     def test_stock_dividends(self):
         sids = np.arange(5)
         dates = self.trading_calendar.sessions
@@ -271,6 +278,40 @@ class TestSQLiteAdjustmentsWriter(
 
         assert_frame_equal(output, input_[sorted(input_.columns)])
 
+    @parameter_space(kind=["dividends", "stock_dividends"])
+    def test_payouts_with_mixed_tz_date_columns(self, kind):
+        sids = np.arange(5)
+        dates = self.trading_calendar.sessions
+        utc_dates = dates.tz_localize("UTC")
+
+        input_ = pd.DataFrame(
+            {
+                "sid": [0, 1],
+                "ex_date": utc_dates[[10, 11]],
+                "record_date": utc_dates[[12, 13]],
+                "declared_date": pd.NaT,
+                "pay_date": pd.NaT,
+            }
+        )
+        if kind == "dividends":
+            input_["amount"] = [0.5, 1.0]
+        else:
+            input_["payment_sid"] = [1, 2]
+            input_["ratio"] = [1.5, 2.0]
+
+        self.writer_without_pricing(dates, sids).write(**{kind: input_})
+        output = self.component_dataframes()[
+            kind.replace("dividends", "dividend_payouts")
+        ].sort_values("sid")
+
+        expected = input_.assign(
+            ex_date=dates[[10, 11]],
+            record_date=dates[[12, 13]],
+            declared_date=pd.NaT,
+            pay_date=pd.NaT,
+        )
+        assert_frame_equal(output, expected[sorted(expected.columns)])
+
     @parameter_space(convert_dates=[True, False])
     def test_empty_frame_dtypes(self, convert_dates):
         """Test that dataframe dtypes are preserved for empty tables."""
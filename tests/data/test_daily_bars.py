@@ -586,6 +586,22 @@ class BcolzDailyBarTestCase(WithBcolzEquityDailyBarReader, _DailyBarsTestCase):
                 pd.NaT,
             )
 
+    def test_get_last_traded_dt_successive_sessions(self):
+        # Walk forward through every session, as a simulation would, and
+        # check that holes are skipped over.
+        for sid in self.assets:
+            asset = self.asset_finder.retrieve_asset(sid)
+            holes = set(self.holes.get(sid, ()))
+            traded = [date for date in self.dates_for_asset(sid) if date not in holes]
+            last_traded = pd.NaT
+            for session in self.sessions:
+                if traded and traded[0] <= session:
+                    last_traded = traded.pop(0)
+                assert_equal(
+                    self.daily_bar_reader.get_last_traded_dt(asset, session),
+                    last_traded,
+                )
+
     def test_listing_currency(self):
         # Test loading on all assets.
         all_assets = np.array(list(self.assets))
@@ -17,7 +17,7 @@ import os
 import numpy as np
 import pandas as pd
 from numpy.testing import assert_almost_equal, assert_array_equal
-from unittest import skip
+from pandas.testing import assert_frame_equal
 
 from zipline.data.bar_reader import NoDataForSid, NoDataOnDate
 from zipline.data.bcolz_minute_bars import (
@@ -1118,7 +1118,6 @@ class BcolzMinuteBarTestCase(
             "close and the next open."
         )
 
-    @skip("not requiring tables for now")
     def test_minute_updates(self):
         """Test minute updates."""
         start_minute = self.market_opens[TEST_CALENDAR_START]
@@ -1180,3 +1179,41 @@ class BcolzMinuteBarTestCase(
         for i, col in enumerate(columns):
             for j, sid in enumerate(sids):
                 assert_almost_equal(data[sid][col], arrays[i][j])
+
+    def test_minute_update_reader_subsets(self):
+        """Test reading subsets of the sids and minutes of an update file."""
+        start_minute = self.market_opens[TEST_CALENDAR_START]
+        minutes = pd.date_range(start_minute, periods=3, freq="min")
+        frames = {
+            sid: pd.DataFrame(
+                data={
+                    "open": [10.0 * sid, 10.1 * sid, 10.2 * sid],
+                    "high": [11.0 * sid, 11.1 * sid, 11.2 * sid],
+                    "low": [9.0 * sid, 9.1 * sid, 9.2 * sid],
+                    "close": [10.5 * sid, 10.6 * sid, 10.7 * sid],
+                    "volume": [100 * sid, 101 * sid, 102 * sid],
+                },
+                index=minutes,
+            )
+            for sid in (1, 2, 3)
+        }
+        update_path = self.instance_tmpdir.getpath("updates.h5")
+        H5MinuteBarUpdateWriter(update_path).write(frames)
+        update_reader = H5MinuteBarUpdateReader(update_path)
+
+        result = dict(update_reader.read(minutes, [1, 2, 3]))
+        assert sorted(result) == [1, 2, 3]
+        for sid, frame in frames.items():
+            assert_frame_equal(result[sid], frame, check_names=False, check_freq=False)
+
+        result = dict(update_reader.read(minutes[1:], [3, 1]))
+        assert sorted(result) == [1, 3]
+        for sid in (1, 3):
+            assert_frame_equal(
+                result[sid],
+                frames[sid].iloc[1:],
+                check_names=False,
+                check_freq=False,
+            )
+
+        assert list(update_reader.read(minutes, [])) == []
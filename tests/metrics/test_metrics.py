@@ -1,3 +1,6 @@
+from types import SimpleNamespace
+
+import empyrical as ep
 import numpy as np
 import pandas as pd
 
@@ -6,6 +9,7 @@ from zipline.assets import Equity, Future
 from zipline.assets.synthetic import make_commodity_future_info
 from zipline.data.data_portal import DataPortal
 from zipline.data.resample import MinuteResampleSessionBarReader
+from zipline.finance.metrics.metric import MaxDrawdown
 from zipline.testing import (
     parameter_space,
     prices_generating_returns,
@@ -2314,3 +2318,22 @@ class TestFixedReturns(WithMakeAlgo, ZiplineTestCase):
             check_names=False,
             check_dtype=False,
         )
+
+
+class TestMaxDrawdown:
+    def test_matches_empyrical(self):
+        returns = np.random.RandomState(42).normal(0, 0.05, 100)
+        returns[[3, 17, 60]] = np.nan
+
+        metric = MaxDrawdown()
+        metric.start_of_simulation()
+        ledger = SimpleNamespace(daily_returns_array=np.zeros(len(returns)))
+        for session_ix, daily_return in enumerate(returns):
+            # the current session's return is revised on every bar
+            for fraction in (0.5, 1.0):
+                ledger.daily_returns_array[session_ix] = daily_return * fraction
+                packet = {"cumulative_risk_metrics": {}}
+                metric.end_of_bar(packet, ledger, None, session_ix, None)
+
+                expected = ep.max_drawdown(ledger.daily_returns_array[: session_ix + 1])
+                assert packet["cumulative_risk_metrics"]["max_drawdown"] == expected
@@ -42,7 +42,11 @@ from zipline.assets import (
     Future,
 )
 from zipline.assets.asset_db_migrations import downgrade
-from zipline.assets.asset_db_schema import ASSET_DB_VERSION
+from zipline.assets.asset_db_schema import (
+    ASSET_DB_VERSION,
+    asset_db_table_names,
+    metadata as asset_db_metadata,
+)
 from zipline.assets.asset_writer import (
     SQLITE_MAX_VARIABLE_NUMBER,
     _futures_defaults,
@@ -1176,6 +1180,22 @@ class TestAssetFinder:
                 result = result[permuted_sids]
                 assert_frame_equal(result, expected_no_start)
 
+    def test_compute_lifetimes_large_sids(self, asset_finder):
+        # sids above 2 ** 53 are not exactly representable as floats
+        sids = [2**53 + 1, 2**62 + 1]
+        finder = asset_finder(
+            equities=make_simple_equity_info(
+                sids,
+                pd.Timestamp("2014-01-02"),
+                pd.Timestamp("2014-01-06"),
+            ),
+            exchanges=pd.DataFrame({"exchange": ["TEST"], "country_code": ["US"]}),
+        )
+        dates = pd.date_range("2014-01-02", "2014-01-06")
+        result = finder.lifetimes(dates, include_start_date=True, country_codes=("US",))
+        assert_index_equal(result.columns, pd.Index(sids, dtype="int64"))
+        assert result.all(axis=None)
+
     def test_sids(self, asset_finder):
         # Ensure that the sids property of the AssetFinder is functioning
         asset_finder = asset_finder(
@@ -2395,6 +2415,25 @@ class TestWrite:
             expected_exchange = "EXCHANGE-%d-%d" % (eq.sid, len(dates) - 1)
             assert eq.exchange == expected_exchange
 
+    def test_write_to_partially_created_db(self):
+        # Create every table but the one probed for an existing db, so the
+        # writer takes the new-db path with some indexes already in place.
+        probed = next(iter(asset_db_table_names))
+        asset_db_metadata.create_all(
+            self.assets_db_path,
+            tables=[t for t in asset_db_metadata.sorted_tables if t.name != probed],
+        )
+
+        equities = make_simple_equity_info(
+            [0, 1],
+            pd.Timestamp("2014-01-01"),
+            pd.Timestamp("2014-12-31"),
+        )
+        self.writer.write(equities=equities)
+
+        reader = self.new_asset_finder()
+        assert set(reader.sids) == {0, 1}
+
     def test_write_direct(self):
         # don't include anything with a default to test that those work.
         equities = pd.DataFrame(
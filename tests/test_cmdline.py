@@ -1,3 +1,4 @@
+import threading
 from unittest import mock
 
 import zipline.__main__ as main
@@ -207,3 +208,72 @@ class TestCmdLine:
         assert spec.benchmark_sid is None
         assert spec.benchmark_symbol is None
         assert spec.no_benchmark is False
+
+    @pytest.mark.parametrize("jobs", ["1", "2"])
+    def test_ingest_multiple_bundles(self, jobs):
+        runner = CliRunner()
+        with mock.patch.object(main.bundles_module, "ingest") as mock_ingest:
+            result = runner.invoke(
+                main.main,
+                ["--no-default-extension", "ingest", "-b", "a", "-b", "b", "-j", jobs],
+                catch_exceptions=False,
+            )
+
+        assert result.exit_code == 0
+        assert sorted(call.args[0] for call in mock_ingest.call_args_list) == [
+            "a",
+            "b",
+        ]
+        # all bundles are stamped with the same ingestion time
+        assert len({call.args[2] for call in mock_ingest.call_args_list}) == 1
+
+    def test_ingest_runs_single_job_on_main_thread(self):
+        runner = CliRunner()
+        threads = []
+        with mock.patch.object(
+            main.bundles_module,
+            "ingest",
+            side_effect=lambda *args: threads.append(threading.current_thread()),
+        ):
+            result = runner.invoke(
+                main.main,
+                ["--no-default-extension", "ingest", "-b", "a", "-b", "b"],
+                catch_exceptions=False,
+            )
+
+        assert result.exit_code == 0
+        assert threads == [threading.main_thread()] * 2
+
+    def test_ingest_deduplicates_bundles(self):
+        runner = CliRunner()
+        with mock.patch.object(main.bundles_module, "ingest") as mock_ingest:
+            result = runner.invoke(
+                main.main,
+                ["--no-default-extension", "ingest", "-b", "a", "-b", "a", "-j", "2"],
+                catch_exceptions=False,
+            )
+
+        assert result.exit_code == 0
+        assert [call.args[0] for call in mock_ingest.call_args_list] == ["a"]
+
+    def test_ingest_all_bundles(self):
+        registered = ["all-a", "all-b", ".hidden-all"]
+        for name in registered:
+            main.bundles_module.register(name, lambda *args: None)
+
+        runner = CliRunner()
+        try:
+            with mock.patch.object(main.bundles_module, "ingest") as mock_ingest:
+                result = runner.invoke(
+                    main.main,
+                    ["--no-default-extension", "ingest", "--all"],
+                    catch_exceptions=False,
+                )
+        finally:
+            for name in registered:
+                main.bundles_module.unregister(name)
+
+        assert result.exit_code == 0
+        ingested = {call.args[0] for call in mock_ingest.call_args_list}
+        assert {"all-a", "all-b"} <= ingested
+        assert ".hidden-all" not in ingested
@@ -1,5 +1,11 @@
+import numpy as np
 import pandas as pd
-from zipline.utils.cache import CachedObject, Expired, ExpiringCache
+from zipline.utils.cache import (
+    CachedObject,
+    Expired,
+    ExpiringCache,
+    dataframe_cache,
+)
 import pytest
 
 
@@ -59,3 +65,30 @@ class TestExpiringCache:
         # Should raise similar KeyError on non-existent key.
         with pytest.raises(KeyError, match="baz"):
             cache.get("baz", expiry_3)
+
+
+class TestDataFrameCache:
+    @pytest.mark.parametrize(
+        "serialization", ["pickle", "pickle:4", "parquet", "feather"]
+    )
+    def test_round_trip(self, tmp_path, serialization):
+        if serialization in ("parquet", "feather"):
+            pytest.importorskip("pyarrow")
+
+        df = pd.DataFrame(
+            {"close": np.arange(5, dtype="float64"), "volume": np.arange(5)},
+            index=pd.date_range("2014-01-02", periods=5, name="date"),
+        )
+        cache = dataframe_cache(str(tmp_path), serialization=serialization)
+        cache["AAPL"] = df
+
+        assert list(cache) == ["AAPL"]
+        pd.testing.assert_frame_equal(cache["AAPL"], df, check_freq=False)
+
+        del cache["AAPL"]
+        with pytest.raises(KeyError, match="AAPL"):
+            cache["AAPL"]
+
+    def test_invalid_serialization(self, tmp_path):
+        with pytest.raises(ValueError, match="serialization"):
+            dataframe_cache(str(tmp_path), serialization="csv")
@@ -0,0 +1,37 @@
+import pytest
+from zipline.utils.functional import prefetch
+
+
+@pytest.mark.parametrize("maxsize", [1, 4, 100])
+def test_prefetch_preserves_order(maxsize):
+    assert list(prefetch(iter(range(50)), maxsize=maxsize)) == list(range(50))
+
+
+def test_prefetch_empty():
+    assert list(prefetch(iter(()))) == []
+
+
+def test_prefetch_reraises_producer_error():
+    def items():
+        yield 1
+        raise ValueError("boom")
+
+    it = prefetch(items())
+    assert next(it) == 1
+    with pytest.raises(ValueError, match="boom"):
+        next(it)
+
+
+def test_prefetch_stops_producer_when_closed():
+    produced = []
+
+    def items():
+        for i in range(1000):
+            produced.append(i)
+            yield i
+
+    it = prefetch(items(), maxsize=1)
+    assert next(it) == 0
+    it.close()
+    # The producer gives up instead of running the source to completion.
+    assert len(produced) < 1000